@@ -0,0 +1,297 @@
+import argparse
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from pick_log import EventType, PickLog
+
+COMPLETION_GLOB = "completed_*.json"
+CACHE_FILE = "completions_cache.npz"
+
+# One row per order line in the completion files
+LINE_COLUMNS = (
+    ('order', np.uint32),
+    ('station', np.uint16),
+    ('sku', np.uint32),
+    ('required', np.int32),   # -1 where the file predates required_items
+    ('picked', np.int32),
+    ('completed_at', np.float64),
+)
+TABLES = ('order', 'station', 'sku')
+
+class ShiftData:
+    """
+    Completed order lines held as NumPy columns.
+
+    Strings are dictionary-coded into `tables`. Built by parsing the
+    completion JSON files once; `from_directory` keeps a columnar cache next
+    to them and only parses files added since the cache was written.
+    """
+
+    def __init__(self, columns: Dict, tables: Dict[str, List[str]], files: List[str]):
+        self.columns = columns
+        self.tables = tables
+        self.files = files
+
+    def __len__(self) -> int:
+        return len(self.columns['sku'])
+
+    @classmethod
+    def empty(cls) -> "ShiftData":
+        return cls(
+            {name: np.zeros(0, dtype=dtype) for name, dtype in LINE_COLUMNS},
+            {kind: [] for kind in TABLES},
+            []
+        )
+
+    @classmethod
+    def from_completion_files(cls, paths: List[Path]) -> "ShiftData":
+        data = cls.empty()
+        data.append_files(paths)
+        return data
+
+    def append_files(self, paths: List[Path]) -> None:
+        """Parse completion files and append their lines to the columns."""
+        ids = {kind: {v: i for i, v in enumerate(self.tables[kind])} for kind in TABLES}
+
+        def intern(kind, value):
+            key = ids[kind].get(value)
+            if key is None:
+                key = ids[kind][value] = len(self.tables[kind])
+                self.tables[kind].append(value)
+            return key
+
+        rows = {name: [] for name, _ in LINE_COLUMNS}
+        for path in paths:
+            with open(path) as f:
+                record = json.load(f)
+            order = intern('order', record['order_id'])
+            station = intern('station', record.get('station', ""))
+            completed_at = datetime.fromisoformat(record['completed_at']).timestamp()
+            picked = record.get('picked_items', {})
+            required = record.get('required_items')
+            skus = required.keys() if required is not None else picked.keys()
+            for sku in skus:
+                rows['order'].append(order)
+                rows['station'].append(station)
+                rows['sku'].append(intern('sku', sku))
+                rows['required'].append(required[sku] if required is not None else -1)
+                rows['picked'].append(picked.get(sku, 0))
+                rows['completed_at'].append(completed_at)
+            self.files.append(Path(path).name)
+
+        for name, dtype in LINE_COLUMNS:
+            self.columns[name] = np.concatenate(
+                [self.columns[name], np.array(rows[name], dtype=dtype)]
+            )
+
+    def save(self, path: Path) -> None:
+        arrays = dict(self.columns)
+        for kind in TABLES:
+            arrays[f"table_{kind}"] = np.array(self.tables[kind], dtype=str)
+        arrays['files'] = np.array(self.files, dtype=str)
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path: Path) -> "ShiftData":
+        with np.load(path) as cache:
+            return cls(
+                {name: cache[name] for name, _ in LINE_COLUMNS},
+                {kind: cache[f"table_{kind}"].tolist() for kind in TABLES},
+                cache['files'].tolist()
+            )
+
+    @classmethod
+    def from_directory(cls, data_dir, use_cache: bool = True) -> "ShiftData":
+        """
+        Load all completion files in a directory.
+
+        With `use_cache`, lines already parsed are read from the columnar
+        cache and only new completion files are parsed. The cache is rebuilt
+        if any file it covers has been removed.
+        """
+        data_dir = Path(data_dir)
+        paths = {p.name: p for p in data_dir.glob(COMPLETION_GLOB)}
+        cache_path = data_dir / CACHE_FILE
+
+        data = None
+        if use_cache and cache_path.exists():
+            data = cls.load(cache_path)
+            if not set(data.files) <= paths.keys():
+                data = None
+        if data is None:
+            data = cls.empty()
+
+        new = sorted(paths.keys() - set(data.files))
+        if new:
+            data.append_files([paths[name] for name in new])
+            if use_cache:
+                data.save(cache_path)
+        return data
+
+
+class ShiftAnalytics:
+    """
+    Shift metrics computed with vectorized operations over ShiftData.
+
+    Over-pick attempts are not visible in completion files (the matcher
+    refuses them), so they come from the pick log when one is given.
+    """
+
+    def __init__(self, data: ShiftData, pick_log: Optional[PickLog] = None):
+        self.data = data
+        self.pick_log = pick_log
+        self.logger = logging.getLogger(__name__)
+
+    def short_picks(self) -> Dict:
+        """Short-pick rate by order line and by units, overall and per station."""
+        cols = self.data.columns
+        known = cols['required'] >= 0
+        required = cols['required'][known]
+        short_units = np.maximum(required - cols['picked'][known], 0)
+        stations = cols['station'][known]
+        size = len(self.data.tables['station'])
+
+        lines = np.bincount(stations, minlength=size)
+        short_lines = np.bincount(stations, weights=short_units > 0, minlength=size)
+        units = np.bincount(stations, weights=required, minlength=size)
+        units_short = np.bincount(stations, weights=short_units, minlength=size)
+
+        def rates(n_lines, n_short, n_units, n_units_short):
+            return {
+                'lines': int(n_lines),
+                'short_lines': int(n_short),
+                'line_rate': n_short / n_lines if n_lines else 0.0,
+                'unit_rate': n_units_short / n_units if n_units else 0.0
+            }
+
+        return {
+            'overall': rates(lines.sum(), short_lines.sum(),
+                             units.sum(), units_short.sum()),
+            'stations': {
+                self.data.tables['station'][key]: rates(
+                    lines[key], short_lines[key], units[key], units_short[key]
+                )
+                for key in np.flatnonzero(lines).tolist()
+            }
+        }
+
+    def over_pick_attempts(self, limit: int = 10) -> Dict:
+        """Duplicate scans past the required quantity, total and worst SKUs."""
+        if self.pick_log is None or not len(self.pick_log):
+            return {'total': 0, 'skus': []}
+        cols = self.pick_log.as_arrays()
+        skus = cols['sku'][cols['type'] == EventType.SCAN_DUPLICATE]
+        counts = np.bincount(skus, minlength=len(self.pick_log.tables['sku']))
+        top = np.argsort(counts, kind='stable')[::-1][:limit]
+        return {
+            'total': int(counts.sum()),
+            'skus': [
+                {'sku': self.pick_log.name('sku', key), 'attempts': int(counts[key])}
+                for key in top.tolist() if counts[key]
+            ]
+        }
+
+    def throughput_per_hour(self) -> Dict[str, Dict[str, int]]:
+        """Units picked per station per clock hour of order completion."""
+        cols = self.data.columns
+        if not len(self.data):
+            return {}
+        hours = (cols['completed_at'] // 3600).astype(np.int64)
+        first_hour = hours.min()
+        span = int(hours.max() - first_hour) + 1
+        size = len(self.data.tables['station'])
+
+        grid = np.bincount(
+            cols['station'].astype(np.int64) * span + (hours - first_hour),
+            weights=cols['picked'],
+            minlength=size * span
+        ).reshape(size, span)
+
+        labels = [
+            datetime.fromtimestamp((first_hour + h) * 3600).strftime("%Y-%m-%d %H:00")
+            for h in range(span)
+        ]
+        report = {}
+        for key in np.flatnonzero(grid.any(axis=1)).tolist():
+            row = grid[key]
+            report[self.data.tables['station'][key] or "unknown"] = {
+                labels[h]: int(row[h]) for h in np.flatnonzero(row).tolist()
+            }
+        return report
+
+    def sku_velocity(self, limit: int = 20) -> List[Dict]:
+        """SKUs ranked by units picked, fastest moving first."""
+        cols = self.data.columns
+        size = len(self.data.tables['sku'])
+        units = np.bincount(cols['sku'], weights=cols['picked'], minlength=size)
+        orders = np.bincount(cols['sku'], weights=cols['picked'] > 0, minlength=size)
+        top = np.argsort(units, kind='stable')[::-1][:limit]
+        return [
+            {'sku': self.data.tables['sku'][key], 'units': int(units[key]),
+             'orders': int(orders[key])}
+            for key in top.tolist() if units[key]
+        ]
+
+    def report(self, limit: int = 20) -> Dict:
+        return {
+            'order_lines': len(self.data),
+            'short_picks': self.short_picks(),
+            'over_pick_attempts': self.over_pick_attempts(limit),
+            'throughput_per_hour': self.throughput_per_hour(),
+            'sku_velocity': self.sku_velocity(limit)
+        }
+
+
+def print_report(report: Dict) -> None:
+    short = report['short_picks']['overall']
+    print(f"Order lines: {report['order_lines']}")
+    print(f"Short picks: {short['short_lines']}/{short['lines']} lines "
+          f"({short['line_rate']:.1%}), {short['unit_rate']:.1%} of units")
+    for station, rates in report['short_picks']['stations'].items():
+        print(f"  {station or 'unknown'}: {rates['line_rate']:.1%} of lines")
+
+    print(f"Over-pick attempts: {report['over_pick_attempts']['total']}")
+    for entry in report['over_pick_attempts']['skus']:
+        print(f"  {entry['sku']}: {entry['attempts']}")
+
+    print("Throughput (units/hour):")
+    for station, hours in report['throughput_per_hour'].items():
+        print(f"  {station}:")
+        for hour, units in hours.items():
+            print(f"    {hour}  {units}")
+
+    print("SKU velocity:")
+    for rank, entry in enumerate(report['sku_velocity'], 1):
+        print(f"  {rank:3d}. {entry['sku']}: {entry['units']} units "
+              f"in {entry['orders']} orders")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Shift analytics over completed orders")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--top", type=int, default=20, help="rows in ranked lists")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="reparse every completion file")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--compact", action="store_true",
+                        help="merge the pick log segments read into one file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    data = ShiftData.from_directory(args.data_dir, use_cache=not args.no_cache)
+    pick_log = PickLog.load(args.data_dir, compact=args.compact)
+    report = ShiftAnalytics(data, pick_log).report(args.top)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import csv
+import logging
+import threading
+from typing import Dict, List, Optional
+from pathlib import Path
+
+class SkuCatalog:
+    def __init__(self, data_dir: str = "data", filename: str = "item_skus.csv"):
+        self.sku_file = Path(data_dir) / filename
+        self.names: Dict[str, str] = {}
+        # Catalog file order; binary order encodings index into this list
+        self.skus: List[str] = []
+        self.unit_weights: Dict[str, float] = {}
+        self.ready = threading.Event()
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def load(self) -> Dict[str, str]:
+        """
+        Load SKU names and unit weights (grams, optional) from the catalog CSV.
+
+        Safe to call from a background thread: the lookup table is built
+        locally and swapped in once complete, then `ready` is set.
+
+        Returns:
+            Dict mapping SKU to item name
+        """
+        names = {}
+        skus = []
+        unit_weights = {}
+        try:
+            with open(self.sku_file, newline='') as f:
+                for row in csv.DictReader(f):
+                    if row['SKU'] not in names:
+                        skus.append(row['SKU'])
+                    names[row['SKU']] = row['Name']
+                    if row.get('UnitWeight'):
+                        unit_weights[row['SKU']] = float(row['UnitWeight'])
+        except FileNotFoundError:
+            self.logger.warning(f"SKU catalog {self.sku_file} not found")
+        finally:
+            self.names = names
+            self.skus = skus
+            self.unit_weights = unit_weights
+            self.ready.set()
+
+        self.logger.info(f"Loaded {len(names)} SKUs from catalog")
+        return names
+
+    def get_name(self, sku: str) -> Optional[str]:
+        """Get the item name for a SKU, or None if unknown or not yet loaded."""
+        return self.names.get(sku)
+
+    def get_unit_weight(self, sku: str) -> Optional[float]:
+        """Get the weight of one unit in grams, or None if unknown."""
+        return self.unit_weights.get(sku)
+
+    def __contains__(self, sku: str) -> bool:
+        return sku in self.names
+
+    def __len__(self) -> int:
+        return len(self.names)
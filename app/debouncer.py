@@ -0,0 +1,108 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+class ScanDebouncer:
+    """
+    Temporal duplicate suppression for a continuous barcode stream.
+
+    A camera reads the same label many times per second while it is in view.
+    Each barcode value is tracked in a bounded table (oldest values are
+    evicted once `capacity` is reached) and counted at most once per visit:
+
+    - a read is accepted only if the value is armed and at least `hold_off`
+      seconds have passed since it was last accepted;
+    - accepting a value disarms it;
+    - a value re-arms when no read of it arrives for `rearm_gap` seconds,
+      meaning the label left the field of view, or when `rearm` is called
+      (the "count this again" gesture for identical items in view). A gap
+      that ends inside the hold-off does not re-arm, so a dropout right
+      after a count is treated as flicker.
+
+    Every operation is O(1) per read.
+    """
+
+    def __init__(
+        self,
+        hold_off: float = 0.5,
+        rearm_gap: float = 0.25,
+        capacity: int = 256,
+        clock=time.monotonic
+    ):
+        self.hold_off = hold_off
+        self.rearm_gap = rearm_gap
+        self.capacity = capacity
+        self.clock = clock
+        # value -> [last read ts, last accepted ts, armed]
+        self.values: "OrderedDict[str, list]" = OrderedDict()
+        self.last_accepted: Optional[str] = None
+        self.reads = 0
+        self.accepted = 0
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def feed(self, value: str, ts: Optional[float] = None) -> bool:
+        """
+        Register a read of `value`.
+
+        Returns:
+            True if the read should be processed, False if suppressed
+        """
+        now = self.clock() if ts is None else ts
+        self.reads += 1
+
+        state = self.values.get(value)
+        if state is None:
+            state = [now, None, True]
+            self.values[value] = state
+            if len(self.values) > self.capacity:
+                self.values.popitem(last=False)
+        else:
+            self.values.move_to_end(value)
+            held = state[1] is not None and now - state[1] < self.hold_off
+            if now - state[0] >= self.rearm_gap and not held:
+                state[2] = True
+            state[0] = now
+
+        armed = state[2]
+        held = state[1] is not None and now - state[1] < self.hold_off
+        if not armed or held:
+            return False
+
+        state[1] = now
+        state[2] = False
+        self.last_accepted = value
+        self.accepted += 1
+        return True
+
+    def rearm(self, value: Optional[str] = None) -> bool:
+        """
+        Arm a value so its next read counts, even if it never left view.
+
+        Args:
+            value: Barcode to arm; defaults to the last accepted value
+
+        Returns:
+            True if a value was armed
+        """
+        value = value if value is not None else self.last_accepted
+        state = self.values.get(value)
+        if state is None:
+            return False
+        state[1] = None
+        state[2] = True
+        self.logger.info(f"Re-armed {value}")
+        return True
+
+    @property
+    def suppressed(self) -> int:
+        return self.reads - self.accepted
+
+    def reset(self) -> None:
+        """Forget all tracked values."""
+        self.values.clear()
+        self.last_accepted = None
@@ -1,11 +1,29 @@
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Dict, List
+from collections import deque
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional
+
+# Banner colours and how long each level stays up, in milliseconds
+FEEDBACK_STYLES = {
+    'error': {'background': "#FFCDD2", 'duration': 3000},
+    'warning': {'background': "#FFE0B2", 'duration': 2000},
+    'info': {'background': "#C8E6C9", 'duration': 1500}
+}
+# A queued message is cut short to this once another is waiting behind it
+FEEDBACK_MIN_DURATION = 750
+FEEDBACK_QUEUE_LIMIT = 5
 
 class PickingDisplay:
     def __init__(self, root):
         self.root = root
         self.root.configure(bg="#F5F5F5")
+        self.feedback_queue = deque(maxlen=FEEDBACK_QUEUE_LIMIT)
+        self.cue_handlers: List[Callable[[str, str], None]] = [self.bell_cue]
+        self._feedback_job = None
+        # When the banner on screen went up, and whether it was cut short
+        self._feedback_shown_at = 0.0
+        self._feedback_shortened = False
         self.setup_ui()
         
     def setup_ui(self):
@@ -22,6 +40,15 @@ class PickingDisplay:
         )
         self.status_label.pack(pady=10)
         
+        # Feedback banner, shown only while a message is up
+        self.feedback_label = tk.Label(
+            self.main_frame,
+            text="",
+            font=('Arial', 13),
+            padx=10,
+            pady=6
+        )
+        
         # Order items frame
         self.items_frame = ttk.Frame(self.main_frame)
         self.items_frame.pack(fill=tk.BOTH, expand=True)
@@ -50,28 +77,54 @@ class PickingDisplay:
         
         # Dictionary to track item labels
         self.item_labels = {}
+        self.item_texts: Dict[str, str] = {}
+        # Next-item highlight and cached row positions (fraction of list height)
+        self.highlighted_sku: Optional[str] = None
+        self.row_offsets: Dict[str, float] = {}
+        self.row_height: Optional[float] = None
         
     def show_scan_prompt(self, message: str):
         """Display message prompting for scan"""
         self.status_label.config(text=message)
         self.clear_items()
         
-    def show_order_items(self, order: Dict):
+    def show_status(self, message: str):
+        """Display a status message without clearing the item list"""
+        self.status_label.config(text=message)
+        
+    def show_order_items(
+        self,
+        order: Dict,
+        sku_names: Optional[Dict] = None,
+        sequence: Optional[List[str]] = None
+    ):
         """
         Display order items in scrollable list
         
         Args:
             order: Dict containing order data with items list
+            sku_names: Optional SKU to name lookup for items without a name
+            sequence: Optional SKU order to draw rows in (the pick path), so
+                the next-item highlight moves down the list
         """
+        sku_names = sku_names or {}
         self.clear_items()
         self.status_label.config(text=f"Order: {order['order_id']}")
         
+        items = order['items']
+        if sequence:
+            position = {sku: index for index, sku in enumerate(sequence)}
+            items = sorted(items, key=lambda item: position.get(item['sku'], len(position)))
+            
         # Create label for each item
-        for item in order['items']:
+        for item in items:
             item_frame = ttk.Frame(self.scrollable_frame)
             item_frame.pack(fill=tk.X, pady=2)
             
+            name = item.get('name') or sku_names.get(item['sku'])
             label_text = f"{item['sku']}: {item['quantity']} units"
+            if name:
+                label_text = f"{item['sku']} ({name}): {item['quantity']} units"
             label = ttk.Label(
                 item_frame,
                 text=label_text,
@@ -82,6 +135,7 @@ class PickingDisplay:
             label.pack(fill=tk.X)
             
             self.item_labels[item['sku']] = label
+            self.item_texts[item['sku']] = label_text
             
     def update_item_status(self, sku: str, status: str):
         """
@@ -98,17 +152,141 @@ class PickingDisplay:
         if sku in self.item_labels:
             self.item_labels[sku].configure(background=status_colors[status])
             
+    def highlight_next(self, sku: Optional[str], upcoming: Optional[List[str]] = None):
+        """
+        Move the next-item highlight to `sku` and scroll it into view.
+        
+        Only the previous and new rows are reconfigured. Positions of the
+        `upcoming` rows are computed while idle so the next transition is a
+        cached lookup rather than a layout query.
+        
+        Args:
+            sku: Next SKU to pick, or None to clear the highlight
+            upcoming: SKUs expected after it, in pick-path order
+        """
+        previous = self.highlighted_sku
+        if previous == sku:
+            return
+        if previous in self.item_labels:
+            self.item_labels[previous].configure(
+                text=self.item_texts[previous], font=('Arial', 14)
+            )
+        self.highlighted_sku = sku
+        if sku not in self.item_labels:
+            return
+            
+        self.item_labels[sku].configure(
+            text=f"\u25B6 {self.item_texts[sku]}", font=('Arial', 14, 'bold')
+        )
+        self._scroll_to(sku)
+        if upcoming:
+            self.root.after_idle(self._prefetch_rows, list(upcoming))
+            
+    def _row_offset(self, sku: str) -> float:
+        offset = self.row_offsets.get(sku)
+        if offset is None:
+            height = self.scrollable_frame.winfo_height()
+            if height <= 1:
+                self.scrollable_frame.update_idletasks()
+                height = self.scrollable_frame.winfo_height()
+            row = self.item_labels[sku].master
+            offset = row.winfo_y() / max(height, 1)
+            self.row_offsets[sku] = offset
+        return offset
+        
+    def _prefetch_rows(self, skus: List[str]):
+        for sku in skus:
+            if sku in self.item_labels:
+                self._row_offset(sku)
+                
+    def _scroll_to(self, sku: str):
+        offset = self._row_offset(sku)
+        top, bottom = self.canvas.yview()
+        # Keep a row's worth of margin at the bottom of the view
+        if self.row_height is None:
+            self.row_height = self.item_labels[sku].master.winfo_height() / max(
+                self.scrollable_frame.winfo_height(), 1
+            )
+        if not top <= offset <= bottom - self.row_height:
+            self.canvas.yview_moveto(offset)
+            
     def show_error(self, message: str):
         """Display error message"""
-        messagebox.showerror("Error", message)
+        self.show_feedback(message, 'error')
+        
+    def show_feedback(self, message: str, level: str = 'error'):
+        """
+        Show a non-blocking banner and fire the cue handlers.
+        
+        Messages queue behind the one on screen and dismiss themselves, so
+        scanning carries on while they are shown. A banner with a message
+        waiting behind it stays up for at most FEEDBACK_MIN_DURATION.
+        
+        Args:
+            message: Text to show
+            level: 'error', 'warning' or 'info'
+        """
+        for handler in self.cue_handlers:
+            handler(level, message)
+        self.feedback_queue.append((message, level))
+        if self._feedback_job is None:
+            self._next_feedback()
+        elif not self._feedback_shortened:
+            # Cut the banner on screen short now that a message is waiting
+            elapsed = (time.monotonic() - self._feedback_shown_at) * 1000
+            self.root.after_cancel(self._feedback_job)
+            self._feedback_shortened = True
+            self._feedback_job = self.root.after(
+                max(int(FEEDBACK_MIN_DURATION - elapsed), 0), self._next_feedback
+            )
+        
+    def add_cue_handler(self, handler: Callable[[str, str], None]):
+        """
+        Register an audible/haptic cue, called with (level, message).
+        """
+        self.cue_handlers.append(handler)
+        
+    def bell_cue(self, level: str, message: str):
+        """Default cue: ring the system bell for errors and warnings"""
+        if level != 'info':
+            self.root.bell()
+            
+    def _next_feedback(self):
+        if not self.feedback_queue:
+            self.dismiss_feedback()
+            return
+        message, level = self.feedback_queue.popleft()
+        style = FEEDBACK_STYLES[level]
+        self.feedback_label.config(text=message, background=style['background'])
+        if not self.feedback_label.winfo_ismapped():
+            self.feedback_label.pack(after=self.status_label, fill=tk.X, pady=(0, 10))
+        duration = style['duration']
+        self._feedback_shortened = bool(self.feedback_queue)
+        if self._feedback_shortened:
+            duration = FEEDBACK_MIN_DURATION
+        self._feedback_shown_at = time.monotonic()
+        self._feedback_job = self.root.after(duration, self._next_feedback)
+        
+    def dismiss_feedback(self):
+        """Hide the banner and drop any queued messages"""
+        if self._feedback_job is not None:
+            self.root.after_cancel(self._feedback_job)
+            self._feedback_job = None
+        self.feedback_queue.clear()
+        self.feedback_label.pack_forget()
         
     def clear_items(self):
         """Clear all displayed items"""
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
         self.item_labels.clear()
+        self.item_texts.clear()
+        self.row_offsets.clear()
+        self.row_height = None
+        self.highlighted_sku = None
         
     def reset(self):
         """Reset display to initial state"""
         self.status_label.config(text="")
+        self.dismiss_feedback()
         self.clear_items()
\ No newline at end of file
@@ -0,0 +1,306 @@
+import csv
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Reasons offered when an order is finished short
+SHORT_PICK_REASONS = ("Location empty", "Damaged", "Not found", "Other")
+LOCATION_EMPTY = SHORT_PICK_REASONS[0]
+
+class InventoryCounter:
+    """
+    In-memory on-hand counts per SKU.
+
+    Seeded from a stock CSV (SKU, OnHand, optional ReorderPoint) next to
+    the SKU catalog, or from the last snapshot unless the CSV is newer, so
+    dropping in a new stock file re-seeds the counts. Each validated pick
+    is one dict update; picks recorded before `load` finishes are queued
+    and applied after it. When a SKU falls to its reorder point, or a
+    picker reports its location empty, one replenishment task is opened for
+    it and the replenishment handlers are called. Short picks are kept with
+    their reasons. `snapshot` writes the state to JSON for the next start.
+    """
+
+    def __init__(
+        self,
+        data_dir: str = "data",
+        filename: str = "stock.csv",
+        reorder_point: int = 5,
+        clock=time.time
+    ):
+        """
+        Args:
+            data_dir: Directory holding the stock CSV and snapshot
+            filename: Stock CSV name
+            reorder_point: Threshold for SKUs without a ReorderPoint
+            clock: Time source for task and short pick timestamps
+        """
+        self.stock_file = Path(data_dir) / filename
+        self.snapshot_file = Path(data_dir) / "inventory_snapshot.json"
+        self.default_reorder_point = reorder_point
+        self.clock = clock
+        self.on_hand: Dict[str, int] = {}
+        self.reorder_points: Dict[str, int] = {}
+        # Open replenishment tasks, at most one per SKU
+        self.tasks: Dict[str, Dict] = {}
+        self.short_picks: List[Dict] = []
+        self.replenish_handlers: List[Callable[[Dict], None]] = []
+        self.dirty = False
+        self.ready = threading.Event()
+        # Picks and short picks recorded before load finished
+        self._deferred: List[Tuple[str, tuple]] = []
+        self._lock = threading.Lock()
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def load(self) -> int:
+        """
+        Load counts from the stock CSV if it is newer than the last
+        snapshot, otherwise from the snapshot.
+
+        Re-seeding from the CSV keeps the recorded short picks and the
+        replenishment tasks of SKUs still at or below their reorder point.
+        Safe to call from a background thread; state is swapped in once
+        read, then picks recorded in the meantime are applied.
+
+        Returns:
+            Number of SKUs tracked
+        """
+        on_hand, reorder_points, tasks, short_picks = {}, {}, {}, []
+        reseeded = False
+        had_snapshot = self.snapshot_file.exists()
+        try:
+            if had_snapshot:
+                with open(self.snapshot_file) as f:
+                    state = json.load(f)
+                on_hand = state['on_hand']
+                reorder_points = state['reorder_points']
+                tasks = state['tasks']
+                short_picks = state['short_picks']
+            if not had_snapshot or (
+                self.stock_file.exists()
+                and self.stock_file.stat().st_mtime > self.snapshot_file.stat().st_mtime
+            ):
+                on_hand, reorder_points = self._read_stock_file()
+                reseeded = True
+                tasks = {
+                    sku: task for sku, task in tasks.items()
+                    if on_hand.get(sku, 0) <= reorder_points.get(
+                        sku, self.default_reorder_point
+                    )
+                }
+        except FileNotFoundError:
+            self.logger.warning(f"Stock file {self.stock_file} not found")
+        finally:
+            with self._lock:
+                self.on_hand = on_hand
+                self.reorder_points = reorder_points
+                self.tasks = tasks
+                self.short_picks = short_picks
+                # A re-seed over an older snapshot must replace it
+                self.dirty = reseeded and had_snapshot
+                deferred = self._deferred
+                self._deferred = []
+                self.ready.set()
+
+        for kind, args in deferred:
+            if kind == 'pick':
+                self.record_pick(*args)
+            else:
+                self._apply_short_pick(*args)
+        self.logger.info(
+            f"Loaded stock for {len(on_hand)} SKUs"
+            + (f" from {self.stock_file}" if reseeded else "")
+        )
+        return len(on_hand)
+
+    def _read_stock_file(self) -> Tuple[Dict[str, int], Dict[str, int]]:
+        on_hand, reorder_points = {}, {}
+        with open(self.stock_file, newline='') as f:
+            for row in csv.DictReader(f):
+                on_hand[row['SKU']] = int(row['OnHand'])
+                if row.get('ReorderPoint'):
+                    reorder_points[row['SKU']] = int(row['ReorderPoint'])
+        return on_hand, reorder_points
+
+    def add_replenish_handler(self, handler: Callable[[Dict], None]) -> None:
+        """Call `handler(task)` whenever a replenishment task is opened."""
+        self.replenish_handlers.append(handler)
+
+    def get_on_hand(self, sku: str) -> Optional[int]:
+        """Get the on-hand count for a SKU, or None if it is not tracked."""
+        return self.on_hand.get(sku)
+
+    def reorder_point(self, sku: str) -> int:
+        return self.reorder_points.get(sku, self.default_reorder_point)
+
+    def record_pick(self, sku: str, quantity: int = 1) -> Optional[Dict]:
+        """
+        Take picked units off a SKU's count.
+
+        Args:
+            sku: SKU picked
+            quantity: Number of units picked
+
+        Returns:
+            The replenishment task opened by this pick, if any
+        """
+        with self._lock:
+            if not self.ready.is_set():
+                self._deferred.append(('pick', (sku, quantity)))
+                return None
+            count = self.on_hand.get(sku)
+            if count is None:
+                return None
+            if quantity > count:
+                self.logger.warning(
+                    f"Picked {quantity} of {sku} with {count} on hand; "
+                    f"stock count was low"
+                )
+            count = max(count - quantity, 0)
+            self.on_hand[sku] = count
+            self.dirty = True
+            task = None
+            if count <= self.reorder_point(sku):
+                task = self._open_task(sku, "Low stock")
+        if task:
+            self._notify(task)
+        return task
+
+    def record_short_pick(
+        self,
+        order_id: str,
+        sku: str,
+        quantity: int,
+        reason: str = LOCATION_EMPTY
+    ) -> Dict:
+        """
+        Record units of an order line that could not be picked.
+
+        A short pick because the location is empty sets the SKU's count to
+        zero and opens a replenishment task, so the next picker is warned
+        before walking to it.
+
+        Args:
+            order_id: Order finished short
+            sku: SKU not fully picked
+            quantity: Units missing
+            reason: Why the units were not picked (see SHORT_PICK_REASONS)
+
+        Returns:
+            The short pick record
+        """
+        record = {
+            'order_id': order_id,
+            'sku': sku,
+            'quantity': quantity,
+            'reason': reason,
+            'recorded_at': self.clock()
+        }
+        self.logger.warning(f"Short pick on {order_id}: {quantity} x {sku} ({reason})")
+        with self._lock:
+            if not self.ready.is_set():
+                self._deferred.append(('short', (record,)))
+                return record
+        self._apply_short_pick(record)
+        return record
+
+    def _apply_short_pick(self, record: Dict) -> None:
+        sku = record['sku']
+        reason = record['reason']
+        task = None
+        with self._lock:
+            self.short_picks.append(record)
+            self.dirty = True
+            if reason.strip().lower() == LOCATION_EMPTY.lower():
+                if sku in self.on_hand:
+                    self.on_hand[sku] = 0
+                task = self._open_task(sku, f"Short pick: {reason}")
+        if task:
+            self._notify(task)
+
+    def restock(self, sku: str, quantity: int) -> None:
+        """Add units to a SKU's count and close its replenishment task."""
+        with self._lock:
+            self.on_hand[sku] = self.on_hand.get(sku, 0) + quantity
+            self.dirty = True
+            if self.on_hand[sku] > self.reorder_point(sku):
+                self.tasks.pop(sku, None)
+        self.logger.info(f"Restocked {quantity} x {sku}")
+
+    def shortfalls(self, items: List[Dict]) -> List[Dict]:
+        """
+        Get order lines whose tracked count is below the quantity required.
+
+        Args:
+            items: Order items with 'sku' and 'quantity' keys
+
+        Returns:
+            List of dicts with 'sku', 'required' and 'on_hand'
+        """
+        shortfalls = []
+        for item in items:
+            count = self.on_hand.get(item['sku'])
+            if count is not None and count < item['quantity']:
+                shortfalls.append({
+                    'sku': item['sku'],
+                    'required': item['quantity'],
+                    'on_hand': count
+                })
+        return shortfalls
+
+    def snapshot(self, force: bool = False) -> Optional[Path]:
+        """
+        Write counts, open tasks and short picks to the snapshot file.
+
+        State is copied under the lock and written outside it, so picks
+        never wait on the disk.
+
+        Returns:
+            Path written, or None if nothing changed since the last snapshot
+        """
+        with self._lock:
+            if not self.dirty and not force:
+                return None
+            state = {
+                'taken_at': self.clock(),
+                'on_hand': dict(self.on_hand),
+                'reorder_points': dict(self.reorder_points),
+                'tasks': dict(self.tasks),
+                'short_picks': list(self.short_picks)
+            }
+            self.dirty = False
+
+        tmp_path = self.snapshot_file.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.snapshot_file)
+        return self.snapshot_file
+
+    def _open_task(self, sku: str, reason: str) -> Optional[Dict]:
+        # Called with the lock held
+        if sku in self.tasks:
+            return None
+        task = {
+            'task_id': uuid.uuid4().hex,
+            'sku': sku,
+            'reason': reason,
+            'on_hand': self.on_hand.get(sku),
+            'reorder_point': self.reorder_point(sku),
+            'created_at': self.clock()
+        }
+        self.tasks[sku] = task
+        return task
+
+    def _notify(self, task: Dict) -> None:
+        self.logger.info(f"Replenishment requested for {task['sku']}: {task['reason']}")
+        for handler in self.replenish_handlers:
+            handler(task)
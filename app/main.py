@@ -1,30 +1,155 @@
+import argparse
+import logging
+import socket
+import sys
+import threading
+import time
 import tkinter as tk
-from tkinter import messagebox
-from scanner import BarcodeScanner
+from collections import deque
+from pathlib import Path
+from tkinter import messagebox, simpledialog
+
+# config.py lives at the repository root, one level above this script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import config
+from debouncer import ScanDebouncer
 from order_manager import OrderManager
 from display import PickingDisplay
 from matcher import ItemMatcher
+from catalog import SkuCatalog
+from inventory import InventoryCounter, LOCATION_EMPTY, SHORT_PICK_REASONS
+from pick_log import EventType, PickLog
+from scale import StandInScale, SerialScale, count_from_weight
 
 class WarehousePickingApp:
-    def __init__(self):
+    def __init__(self, pick_client=None, station_id="", scale=None, replica=None):
+        self.started_at = time.perf_counter()
+        self.logger = logging.getLogger(__name__)
         self.root = tk.Tk()
         self.root.title("Warehouse Picking System")
         
-        # Initialize components
-        self.scanner = BarcodeScanner()
-        self.order_manager = OrderManager()
+        # Initialize components. The scanner pulls in cv2, pyzbar and the
+        # AVFoundation bridge, so it is created in the background once the
+        # window has painted (see start_background_init).
+        self.scanner = None
+        self.scanner_error = None
+        self.scanner_ready = threading.Event()
+        self.catalog = SkuCatalog()
+        self.order_manager = OrderManager(
+            pick_client=pick_client,
+            station_id=station_id,
+            replica=replica,
+            catalog=self.catalog
+        )
+        self.replica = replica
+        self._sync_thread = None
         self.matcher = ItemMatcher()
         self.display = PickingDisplay(self.root)
+        self.station_id = station_id
+        self.pick_log = PickLog()
+        self.inventory = InventoryCounter(reorder_point=config.REORDER_POINT)
+        # Replenishment tasks can be opened on the inventory load thread,
+        # so they are queued here and shown from the Tk loop
+        self.replenish_requests = deque()
+        self.inventory.add_replenish_handler(self.on_replenish)
+        self.debouncer = ScanDebouncer(
+            hold_off=config.SCAN_DELAY, rearm_gap=config.SCAN_REARM_GAP
+        )
+        
+        self.scale = scale
         
         # Set initial state
         self.waiting_for_order = True
         self.current_order = None
+        self.pending_quantity = ""
+        self.last_pick = None  # [sku, units counted for that scan]
         
         self.setup_ui()
+        self.root.after_idle(self.start_background_init)
+        
+    def start_background_init(self):
+        """Start camera and catalog initialization off the UI thread."""
+        threading.Thread(target=self._init_scanner, daemon=True).start()
+        threading.Thread(target=self.catalog.load, daemon=True).start()
+        threading.Thread(target=self.inventory.load, daemon=True).start()
+        self.root.after(
+            int(config.INVENTORY_SNAPSHOT_INTERVAL * 1000), self.schedule_snapshot
+        )
+        self.root.after(
+            int(config.PICK_LOG_SAVE_INTERVAL * 1000), self.schedule_pick_log_save
+        )
+        self.poll_replenishments()
+        if self.replica:
+            self.schedule_sync()
+            self.poll_replica()
+        if self.order_manager.pick_client:
+            self.poll_pick_client()
+        
+    def schedule_sync(self):
+        """Sync the order replica off the UI thread every SYNC_INTERVAL."""
+        if self._sync_thread is None or not self._sync_thread.is_alive():
+            self._sync_thread = threading.Thread(target=self.replica.sync, daemon=True)
+            self._sync_thread.start()
+        self.root.after(int(config.SYNC_INTERVAL * 1000), self.schedule_sync)
+        
+    def poll_replica(self):
+        """Show completions the order feed rejected during background syncs."""
+        for conflict in self.replica.take_conflicts():
+            self.display.show_feedback(
+                f"Completion of {conflict['order_id']} rejected: {conflict['reason']}",
+                'error'
+            )
+        self.root.after(1000, self.poll_replica)
+        
+    def poll_pick_client(self):
+        """Show pick server failures reported by the client's sender thread."""
+        for error in self.order_manager.pick_client.take_errors():
+            self.display.show_feedback(error, 'warning')
+        self.root.after(1000, self.poll_pick_client)
+        
+    def poll_replenishments(self):
+        """Show replenishment tasks opened since the last poll."""
+        while self.replenish_requests:
+            task = self.replenish_requests.popleft()
+            self.display.show_feedback(
+                f"Replenishment requested for {task['sku']} ({task['reason']})",
+                'warning'
+            )
+        self.root.after(250, self.poll_replenishments)
+        
+    def schedule_snapshot(self):
+        """Snapshot inventory counts every INVENTORY_SNAPSHOT_INTERVAL."""
+        self.inventory.snapshot()
+        self.root.after(
+            int(config.INVENTORY_SNAPSHOT_INTERVAL * 1000), self.schedule_snapshot
+        )
+        
+    def schedule_pick_log_save(self):
+        """Save new pick log events every PICK_LOG_SAVE_INTERVAL."""
+        self.pick_log.save_segment(self.order_manager.data_dir)
+        self.root.after(
+            int(config.PICK_LOG_SAVE_INTERVAL * 1000), self.schedule_pick_log_save
+        )
+        
+    def _init_scanner(self):
+        try:
+            from scanner import BarcodeScanner
+            self.scanner = BarcodeScanner()
+            self.logger.info(
+                f"Scanner ready in "
+                f"{(time.perf_counter() - self.started_at) * 1000:.0f} ms"
+            )
+        except Exception as e:
+            self.scanner_error = e
+            self.logger.error(f"Scanner initialization failed: {str(e)}")
+        finally:
+            self.scanner_ready.set()
         
     def setup_ui(self):
         self.display.show_scan_prompt("Scan Order Barcode")
         self.root.bind('<Return>', self.handle_scan)
+        self.root.bind('<plus>', self.count_again)
+        self.root.bind('<Key>', self.handle_key)
         
         self.complete_button = tk.Button(
             self.root,
@@ -37,61 +162,265 @@ class WarehousePickingApp:
         self.complete_button.pack(pady=10)
         
     def handle_scan(self, event=None):
-        try:
-            scanned_code = self.scanner.scan_barcode()
+        if not self.scanner_ready.is_set():
+            self.display.show_status("Camera starting, please wait...")
+            return
             
-            if self.waiting_for_order:
-                self.process_order_scan(scanned_code)
-            else:
-                self.process_item_scan(scanned_code)
+        try:
+            if self.scanner is None:
+                raise RuntimeError(f"Camera unavailable: {self.scanner_error}")
+                
+            self.process_scan(self.scanner.scan_barcode())
                 
         except Exception as e:
-            messagebox.showerror("Scan Error", str(e))
+            self.display.show_feedback(f"Scan error: {str(e)}", 'error')
+            
+    def process_scan(self, scanned_code):
+        """Route a barcode read, dropping repeat reads of a label still in view."""
+        if not self.debouncer.feed(scanned_code):
+            return
+            
+        if self.waiting_for_order:
+            self.process_order_scan(scanned_code)
+        else:
+            self.process_item_scan(scanned_code)
+            
+    def count_again(self, event=None):
+        """Let the label in view count once more (identical items in a row)."""
+        if self.waiting_for_order:
+            return
+        if self.debouncer.rearm():
+            self.display.show_status(f"Scan {self.debouncer.last_accepted} again to count it")
             
     def process_order_scan(self, order_code):
         try:
             self.current_order = self.order_manager.load_order(order_code)
-            self.display.show_order_items(self.current_order)
+            self.matcher.load_order_items(
+                self.current_order["items"], self.current_order["picked_items"]
+            )
+            self.display.show_order_items(
+                self.current_order,
+                sku_names=self.catalog.names,
+                sequence=self.matcher.pick_sequence
+            )
             self.waiting_for_order = False
             self.complete_button.config(state="normal")
+            self.record_event(EventType.ORDER_LOADED)
+            self.update_next_item()
+            self.warn_shortfalls(self.current_order)
             
         except Exception as e:
-            messagebox.showerror("Order Error", f"Invalid order: {str(e)}")
+            self.display.show_feedback(f"Invalid order: {str(e)}", 'error')
+            
+    def warn_shortfalls(self, order):
+        """Warn about order lines needing more stock than is on hand."""
+        if order is not self.current_order:
+            return
+        if not self.inventory.ready.is_set():
+            # Stock is still loading; check again shortly
+            self.root.after(100, self.warn_shortfalls, order)
+            return
+        for shortfall in self.inventory.shortfalls(order["items"]):
+            self.display.show_feedback(
+                f"Low stock: {shortfall['sku']} has {shortfall['on_hand']} "
+                f"on hand, order needs {shortfall['required']}",
+                'warning'
+            )
+            
+    def handle_key(self, event):
+        """
+        Keypad quantity entry.
+        
+        Digits build a count. The next item scan picks that many units, or
+        '*' sets the total for the last scan ("scan once, type count").
+        'w' counts the last scanned SKU by weight on the scale.
+        """
+        if self.waiting_for_order:
+            return
+        if event.char.isdigit():
+            self.pending_quantity += event.char
+            self.display.show_status(f"Quantity: {self.pending_quantity}")
+        elif event.keysym == "BackSpace":
+            self.pending_quantity = ""
+            self.display.show_status(f"Order: {self.current_order['order_id']}")
+        elif event.char == "*" and self.pending_quantity:
+            total = int(self.pending_quantity)
+            self.pending_quantity = ""
+            self.apply_count(total)
+        elif event.char == "w":
+            self.count_by_weight()
             
     def process_item_scan(self, item_sku):
+        quantity = int(self.pending_quantity) if self.pending_quantity else 1
+        self.pending_quantity = ""
+        if self.pick_units(item_sku, quantity):
+            self.last_pick = [item_sku, quantity]
+            
+    def apply_count(self, total):
+        """Set the number of units represented by the last scan."""
+        if not self.last_pick:
+            self.display.show_status("Scan an item before entering its count")
+            return
+        sku, counted = self.last_pick
+        if total <= counted:
+            self.display.show_status(f"{counted} of {sku} already counted")
+            return
+        if self.pick_units(sku, total - counted):
+            self.last_pick[1] = total
+            
+    def count_by_weight(self):
+        """Count the last scanned SKU from the scale reading."""
+        if not self.scale or not self.last_pick:
+            self.display.show_status("Scan an item and place it on the scale")
+            return
+        sku = self.last_pick[0]
+        unit_weight = self.catalog.get_unit_weight(sku)
+        try:
+            if unit_weight is None:
+                raise ValueError(f"No unit weight for {sku}")
+            self.apply_count(count_from_weight(self.scale.read_weight(), unit_weight))
+        except (ValueError, RuntimeError) as e:
+            self.display.show_feedback(f"Scale: {str(e)}", 'warning')
+            
+    def pick_units(self, item_sku, quantity):
+        """Validate and record a pick; returns True if it was accepted."""
         try:
-            match_result = self.matcher.check_item(item_sku, self.current_order)
+            match_result = self.matcher.pick_quantity(
+                item_sku, quantity, self.current_order
+            )
             
             if match_result["valid"]:
+                self.order_manager.update_order(item_sku, quantity)
+                self.inventory.record_pick(item_sku, quantity)
+                self.record_event(EventType.SCAN_VALID, item_sku, quantity)
                 self.display.update_item_status(item_sku, "picked")
+                self.update_next_item()
                 
                 if match_result["order_complete"]:
                     self.complete_button.config(bg="green")
+                return True
+                
+            if item_sku in self.matcher.current_items:
+                self.record_event(EventType.SCAN_DUPLICATE, item_sku, quantity)
             else:
-                messagebox.showwarning("Mismatch", "Item not in order")
+                self.record_event(EventType.SCAN_INVALID, item_sku)
+            self.display.show_feedback(match_result["message"], 'error')
                 
         except Exception as e:
-            messagebox.showerror("Scan Error", str(e))
+            self.display.show_feedback(f"Scan error: {str(e)}", 'error')
+        return False
+            
+    def update_next_item(self):
+        """Point the display at the next line to pick."""
+        self.display.highlight_next(
+            self.matcher.next_item(),
+            self.matcher.upcoming_items(config.PREFETCH_ROWS)
+        )
+            
+    def on_replenish(self, task):
+        """Queue a replenishment task for the Tk loop; may run on any thread."""
+        self.replenish_requests.append(task)
             
     def complete_order(self):
+        short_reason = None
         if not self.matcher.is_order_complete(self.current_order):
             if not messagebox.askyesno("Incomplete Order", 
                 "Order is not complete. Do you want to finish anyway?"):
                 return
+            short_reason = simpledialog.askstring(
+                "Short Pick",
+                "Reason for missing items:\n" + ", ".join(SHORT_PICK_REASONS),
+                initialvalue=LOCATION_EMPTY,
+                parent=self.root
+            ) or "Not given"
                 
-        self.order_manager.complete_order(self.current_order["order_id"])
+        try:
+            self.order_manager.complete_order(self.current_order["order_id"])
+        except (ConnectionError, RuntimeError) as e:
+            # The order stays loaded so completion can be retried
+            self.display.show_feedback(f"Could not complete order: {str(e)}", 'error')
+            return
+            
+        if short_reason is not None:
+            self.record_short_picks(short_reason)
+        self.record_event(EventType.ORDER_COMPLETED)
+        self.pick_log.save_segment(self.order_manager.data_dir)
+        self.inventory.snapshot()
         self.reset_state()
         
+    def record_short_picks(self, reason):
+        """Record each unpicked line of the current order as a short pick."""
+        for item in self.matcher.get_remaining_items():
+            self.inventory.record_short_pick(
+                self.current_order["order_id"], item["sku"], item["remaining"], reason
+            )
+        
+    def record_event(self, event_type, sku="", quantity=0):
+        """Append an event for the current order to the pick log."""
+        self.pick_log.record(
+            event_type,
+            self.current_order["order_id"],
+            sku=sku,
+            quantity=quantity,
+            station=self.station_id
+        )
+        
     def reset_state(self):
         self.waiting_for_order = True
         self.current_order = None
+        self.debouncer.reset()
+        self.pending_quantity = ""
+        self.last_pick = None
         self.display.reset()
         self.complete_button.config(state="disabled", bg="blue")
         self.display.show_scan_prompt("Scan Order Barcode")
         
     def run(self):
         self.root.mainloop()
+        self.pick_log.save_segment(self.order_manager.data_dir)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warehouse picking station")
+    parser.add_argument("--server", metavar="HOST:PORT",
+                        help="shared pick server to claim orders from")
+    parser.add_argument("--station", default=socket.gethostname(),
+                        help="station id used for order claims")
+    parser.add_argument("--scale", metavar="PORT",
+                        help="serial port of a counting scale, or a file "
+                             "holding a stand-in reading in grams")
+    parser.add_argument("--feed", metavar="FILE",
+                        help="order file to serve through a local stand-in "
+                             "order feed, synced into an offline replica")
+    parser.add_argument("--zone", default="default",
+                        help="zone whose orders the replica holds")
+    args = parser.parse_args(argv)
+
+    scale = None
+    if args.scale:
+        if Path(args.scale).is_file():
+            scale = StandInScale(reading_file=args.scale)
+        else:
+            scale = SerialScale(args.scale)
+
+    pick_client = None
+    if args.server:
+        from pick_client import PickClient
+        host, _, port = args.server.rpartition(":")
+        pick_client = PickClient(args.station, host=host, port=int(port))
+
+    replica = None
+    if args.feed:
+        from replica import LocalFeed, OrderReplica
+        feed = LocalFeed()
+        for order in OrderManager().load_orders_file(args.feed):
+            feed.publish(order, zone=args.zone)
+        replica = OrderReplica(feed, zone=args.zone)
+
+    app = WarehousePickingApp(
+        pick_client=pick_client, station_id=args.station, scale=scale,
+        replica=replica
+    )
+    app.run()
 
 if __name__ == "__main__":
-    app = WarehousePickingApp()
-    app.run()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,5 +1,7 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import logging
+import re
+import threading
 from dataclasses import dataclass
 
 @dataclass
@@ -7,27 +9,63 @@ class OrderItem:
     sku: str
     quantity_required: int
     quantity_picked: int = 0
+    location: Optional[str] = None
+
+def pick_path_key(location: Optional[str]) -> Tuple:
+    """
+    Sort key walking locations like "A-03-2" aisle, bay, then shelf.
+    
+    Numeric parts compare as numbers. Items without a location sort last.
+    """
+    if not location:
+        return (1,)
+    parts = re.split(r"[-./ ]", location.upper())
+    return (0,) + tuple((0, int(p), "") if p.isdigit() else (1, 0, p) for p in parts)
 
 class ItemMatcher:
     def __init__(self):
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         self.current_items: Dict[str, OrderItem] = {}
+        self.pick_sequence: List[str] = []
+        self._cursor = 0
+        # Lines not yet fully picked, maintained under the lock
+        self._open_lines = 0
+        self._lock = threading.Lock()
         
-    def load_order_items(self, items: List[Dict[str, int]]) -> None:
+    def load_order_items(
+        self,
+        items: List[Dict[str, int]],
+        picked: Optional[Dict[str, int]] = None
+    ) -> None:
         """
         Initialize matcher with order items and their quantities.
         
         Args:
             items: List of dicts with 'sku' and 'quantity' keys
+            picked: Optional SKU to quantity already picked, e.g. when
+                resuming an order claimed from the pick server
         """
+        picked = picked or {}
         self.current_items = {
             item['sku']: OrderItem(
                 sku=item['sku'],
-                quantity_required=item['quantity']
+                quantity_required=item['quantity'],
+                quantity_picked=picked.get(item['sku'], 0),
+                location=item.get('location')
             )
             for item in items
         }
+        # Pick-path order; sorted() is stable so unlocated items keep order
+        self.pick_sequence = sorted(
+            self.current_items,
+            key=lambda sku: pick_path_key(self.current_items[sku].location)
+        )
+        self._cursor = 0
+        self._open_lines = sum(
+            1 for item in self.current_items.values()
+            if item.quantity_picked < item.quantity_required
+        )
         self.logger.info(f"Loaded {len(items)} items for matching")
 
     def check_item(self, sku: str, order: Dict) -> Dict:
@@ -44,9 +82,31 @@ class ItemMatcher:
                 order_complete: bool - If order is now complete
                 message: str - Status/error message
         """
+        return self.pick_quantity(sku, 1, order)
+        
+    def pick_quantity(self, sku: str, quantity: int, order: Dict) -> Dict:
+        """
+        Validate and record several units of a SKU in one step.
+        
+        The whole quantity is accepted or rejected: it is checked against
+        the remaining quantity and applied under a lock, so concurrent
+        scans can never over-pick a line. Only the pick that finishes the
+        last open line reports order_complete.
+        
+        Args:
+            sku: The scanned SKU to validate
+            quantity: Number of units picked (keypad, count or scale)
+            order: Current order data (for reference)
+            
+        Returns:
+            Dict with the same keys as check_item
+        """
         if not self.current_items:
             raise ValueError("No order items loaded")
             
+        if quantity < 1:
+            raise ValueError(f"Quantity must be at least 1, got {quantity}")
+            
         if sku not in self.current_items:
             self.logger.warning(f"Invalid SKU scanned: {sku}")
             return {
@@ -57,23 +117,40 @@ class ItemMatcher:
             
         item = self.current_items[sku]
         
-        if item.quantity_picked >= item.quantity_required:
-            self.logger.warning(f"Item {sku} already fully picked")
-            return {
-                "valid": False,
-                "order_complete": False,
-                "message": f"Required quantity for {sku} already picked"
-            }
+        with self._lock:
+            remaining = item.quantity_required - item.quantity_picked
+            if remaining <= 0:
+                self.logger.warning(f"Item {sku} already fully picked")
+                return {
+                    "valid": False,
+                    "order_complete": False,
+                    "message": f"Required quantity for {sku} already picked"
+                }
+                
+            if quantity > remaining:
+                self.logger.warning(
+                    f"Rejected {quantity} x {sku}: only {remaining} remaining"
+                )
+                return {
+                    "valid": False,
+                    "order_complete": False,
+                    "message": f"Only {remaining} of {sku} remaining, not {quantity}"
+                }
+                
+            # Update pick count
+            item.quantity_picked += quantity
+            order_complete = False
+            if quantity == remaining:
+                self._open_lines -= 1
+                order_complete = self._open_lines == 0
             
-        # Update pick count
-        item.quantity_picked += 1
         self.logger.info(
             f"Validated {sku}: {item.quantity_picked}/{item.quantity_required}"
         )
         
         return {
             "valid": True,
-            "order_complete": self.is_order_complete(order),
+            "order_complete": order_complete,
             "message": "Item validated"
         }
         
@@ -96,7 +173,39 @@ class ItemMatcher:
                 })
         return remaining
 
+    def next_item(self) -> Optional[str]:
+        """
+        Get the next SKU to pick in pick-path order, or None when done.
+        
+        Lines before the cursor are all fully picked and picks never go
+        down, so the cursor only moves forward: amortized O(1) per call.
+        """
+        sequence = self.pick_sequence
+        while self._cursor < len(sequence):
+            item = self.current_items[sequence[self._cursor]]
+            if item.quantity_picked < item.quantity_required:
+                return item.sku
+            self._cursor += 1
+        return None
+        
+    def upcoming_items(self, count: int) -> List[str]:
+        """Get up to `count` unpicked SKUs after the next item, in pick-path order."""
+        upcoming = []
+        if self.next_item() is None:
+            return upcoming
+        sequence = self.pick_sequence
+        index = self._cursor + 1
+        while index < len(sequence) and len(upcoming) < count:
+            item = self.current_items[sequence[index]]
+            if item.quantity_picked < item.quantity_required:
+                upcoming.append(item.sku)
+            index += 1
+        return upcoming
+
     def reset(self) -> None:
         """Clear current order data."""
         self.current_items.clear()
+        self.pick_sequence = []
+        self._cursor = 0
+        self._open_lines = 0
         self.logger.info("Matcher reset")
\ No newline at end of file
@@ -0,0 +1,352 @@
+"""
+Compact binary encoding for orders.
+
+Layout (all integers little-endian):
+
+    magic b"AP" | version (1 byte) | flags (1 byte) | body
+
+flags bit 0 means the body is zlib-compressed; bit 1 marks a bulk file.
+Every body starts with the SKU dictionary it was coded against: the
+catalog size as a varint and a CRC32 of those SKUs, so a payload decodes
+against any catalog that has only grown since.
+
+A single order (barcodes) is stored row-wise with varints:
+
+    order_id | item count | (sku code, quantity) per item | extra fields
+
+A bulk file is stored column-wise as fixed-width arrays, which compress
+well and decode without a per-value Python loop:
+
+    order count | order ids | extra fields | item counts | sku codes | quantities
+
+SKU codes below the catalog size index the catalog; higher codes index a
+table of SKUs missing from it, stored after the header. Item names are not
+stored; they are filled in from the catalog on decode. Order fields other
+than order_id and items travel as compact JSON.
+
+Barcode text is the payload in unpadded base32 behind BARCODE_PREFIX, which
+fits the QR alphanumeric mode.
+"""
+import argparse
+import base64
+import json
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MAGIC = b"AP"
+VERSION = 1
+FLAG_ZLIB = 0x01
+FLAG_BULK = 0x02
+BARCODE_PREFIX = "AP1:"
+FILE_SUFFIX = ".apo"
+
+def write_varint(out: bytearray, value: int) -> None:
+    if value < 0:
+        raise ValueError(f"Cannot encode negative value {value}")
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Return (value, new position)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+def write_bytes(out: bytearray, value: bytes) -> None:
+    write_varint(out, len(value))
+    out += value
+
+def read_bytes(data: bytes, pos: int) -> Tuple[bytes, int]:
+    length, pos = read_varint(data, pos)
+    return data[pos:pos + length], pos + length
+
+def catalog_checksum(skus: Sequence[str]) -> int:
+    return zlib.crc32("\n".join(skus).encode())
+
+def _extras(order: Dict) -> bytes:
+    extra = {k: v for k, v in order.items()
+             if k not in ('order_id', 'items', 'picked_items')}
+    if not extra:
+        return b""
+    return json.dumps(extra, separators=(',', ':')).encode()
+
+def _u32(values) -> bytes:
+    column = array('I', values)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column.tobytes()
+
+def _from_u32(data: bytes) -> array:
+    column = array('I')
+    column.frombytes(data)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column
+
+
+class _SkuCoder:
+    """Maps SKUs to codes against a catalog, collecting unknown SKUs."""
+
+    def __init__(self, skus: Sequence[str]):
+        self.skus = skus
+        self.index = {sku: i for i, sku in enumerate(skus)}
+        self.extra: List[str] = []
+
+    def code(self, sku: str) -> int:
+        key = self.index.get(sku)
+        if key is None:
+            key = self.index[sku] = len(self.skus) + len(self.extra)
+            self.extra.append(sku)
+        return key
+
+    def header(self) -> bytearray:
+        out = bytearray()
+        write_varint(out, len(self.skus))
+        out += catalog_checksum(self.skus).to_bytes(4, 'little')
+        write_bytes(out, "\n".join(self.extra).encode())
+        return out
+
+
+def _read_sku_table(data: bytes, pos: int, skus: Sequence[str]) -> Tuple[List[str], int]:
+    size, pos = read_varint(data, pos)
+    checksum = int.from_bytes(data[pos:pos + 4], 'little')
+    pos += 4
+    if size > len(skus) or catalog_checksum(skus[:size]) != checksum:
+        raise ValueError("Order was encoded against a different SKU catalog")
+    extra, pos = read_bytes(data, pos)
+    table = list(skus[:size])
+    if extra:
+        table += extra.decode().split("\n")
+    return table, pos
+
+
+def _pack(flags: int, body: bytes, compress: Optional[bool]) -> bytes:
+    """Add the header, compressing when asked or (if None) when it helps."""
+    if compress is None or compress:
+        packed = zlib.compress(body, 9)
+        if compress or len(packed) < len(body):
+            return MAGIC + bytes([VERSION, flags | FLAG_ZLIB]) + packed
+    return MAGIC + bytes([VERSION, flags]) + bytes(body)
+
+
+def _unpack(data: bytes) -> Tuple[int, bytes]:
+    if not is_encoded(data):
+        raise ValueError("Not an encoded order")
+    if data[2] != VERSION:
+        raise ValueError(f"Unsupported order encoding version {data[2]}")
+    flags = data[3]
+    body = data[4:]
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+    return flags, body
+
+
+def is_encoded(data: bytes) -> bool:
+    return data[:2] == MAGIC
+
+
+def encode_order(order: Dict, skus: Sequence[str], compress: Optional[bool] = None) -> bytes:
+    """
+    Encode one order.
+
+    Args:
+        order: Order dict with 'order_id' and 'items'
+        skus: Catalog SKUs in catalog order (SkuCatalog.skus)
+        compress: True/False to force zlib on or off; None keeps whichever
+            result is smaller
+
+    Returns:
+        Encoded bytes
+    """
+    coder = _SkuCoder(skus)
+    rows = bytearray()
+    write_bytes(rows, order['order_id'].encode())
+    write_varint(rows, len(order['items']))
+    for item in order['items']:
+        write_varint(rows, coder.code(item['sku']))
+        write_varint(rows, item['quantity'])
+    write_bytes(rows, _extras(order))
+    return _pack(0, coder.header() + rows, compress)
+
+
+def decode_order(
+    data: bytes,
+    skus: Sequence[str],
+    names: Optional[Dict[str, str]] = None
+) -> Dict:
+    """
+    Decode one order encoded by encode_order.
+
+    Args:
+        data: Encoded bytes
+        skus: Catalog SKUs in catalog order
+        names: Optional SKU to name lookup used to fill in item names
+
+    Raises:
+        ValueError: If the data is not a single encoded order or the
+            catalog does not match
+    """
+    flags, body = _unpack(data)
+    if flags & FLAG_BULK:
+        raise ValueError("Data holds several orders; use decode_orders")
+    table, pos = _read_sku_table(body, 0, skus)
+    order_id, pos = read_bytes(body, pos)
+    count, pos = read_varint(body, pos)
+    items = []
+    for _ in range(count):
+        code, pos = read_varint(body, pos)
+        quantity, pos = read_varint(body, pos)
+        items.append({'sku': table[code], 'quantity': quantity})
+    extra, pos = read_bytes(body, pos)
+
+    order = json.loads(extra) if extra else {}
+    order['order_id'] = order_id.decode()
+    order['items'] = _with_names(items, names)
+    return order
+
+
+def encode_orders(
+    orders: List[Dict],
+    skus: Sequence[str],
+    compress: Optional[bool] = True
+) -> bytes:
+    """Encode many orders column-wise, for bulk order files."""
+    coder = _SkuCoder(skus)
+    counts, codes, quantities = [], [], []
+    for order in orders:
+        counts.append(len(order['items']))
+        for item in order['items']:
+            codes.append(coder.code(item['sku']))
+            quantities.append(item['quantity'])
+
+    body = bytearray()
+    write_varint(body, len(orders))
+    write_bytes(body, "\n".join(o['order_id'] for o in orders).encode())
+    write_bytes(body, b"\n".join(_extras(o) for o in orders))
+    for column in (counts, codes, quantities):
+        write_bytes(body, _u32(column))
+    return _pack(FLAG_BULK, coder.header() + body, compress)
+
+
+def decode_orders(
+    data: bytes,
+    skus: Sequence[str],
+    names: Optional[Dict[str, str]] = None
+) -> List[Dict]:
+    """Decode orders encoded by encode_orders (or a single encode_order)."""
+    flags, body = _unpack(data)
+    if not flags & FLAG_BULK:
+        return [decode_order(data, skus, names)]
+    table, pos = _read_sku_table(body, 0, skus)
+    n_orders, pos = read_varint(body, pos)
+    order_ids, pos = read_bytes(body, pos)
+    extras, pos = read_bytes(body, pos)
+    columns = []
+    for _ in range(3):
+        column, pos = read_bytes(body, pos)
+        columns.append(_from_u32(column))
+    counts, codes, quantities = columns
+
+    ids = order_ids.decode().split("\n") if n_orders else []
+    extras = extras.split(b"\n") if n_orders else []
+    items = _with_names(
+        [{'sku': table[code], 'quantity': quantity}
+         for code, quantity in zip(codes.tolist(), quantities.tolist())],
+        names
+    )
+    orders = []
+    start = 0
+    for order_id, extra, count in zip(ids, extras, counts.tolist()):
+        end = start + count
+        order = json.loads(extra) if extra else {}
+        order['order_id'] = order_id
+        order['items'] = items[start:end]
+        orders.append(order)
+        start = end
+    return orders
+
+
+def _with_names(items: List[Dict], names: Optional[Dict[str, str]]) -> List[Dict]:
+    if names:
+        for item in items:
+            name = names.get(item['sku'])
+            if name:
+                item['name'] = name
+    return items
+
+
+def to_barcode_text(data: bytes) -> str:
+    """Wrap encoded bytes as QR-alphanumeric-safe text."""
+    return BARCODE_PREFIX + base64.b32encode(data).decode().rstrip("=")
+
+def is_barcode_text(text: str) -> bool:
+    return text.startswith(BARCODE_PREFIX)
+
+def from_barcode_text(text: str) -> bytes:
+    payload = text[len(BARCODE_PREFIX):]
+    return base64.b32decode(payload + "=" * (-len(payload) % 8))
+
+
+def _read_json_orders(path: Path) -> List[Dict]:
+    with open(path) as f:
+        data = json.load(f)
+    if 'orders' in data:
+        return list(data['orders'].values())
+    return [data]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Binary order encoding tools")
+    parser.add_argument("--data-dir", default="data",
+                        help="directory holding item_skus.csv")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    encode = commands.add_parser("encode", help="JSON order file to binary")
+    encode.add_argument("source")
+    encode.add_argument("-o", "--output", required=True)
+
+    decode = commands.add_parser("decode", help="binary order file to JSON")
+    decode.add_argument("source")
+
+    barcode = commands.add_parser("barcode", help="print barcode text for an order")
+    barcode.add_argument("source", help="JSON order file")
+    barcode.add_argument("--order-id", help="order to pick from a multi-order file")
+
+    args = parser.parse_args(argv)
+
+    from catalog import SkuCatalog
+    catalog = SkuCatalog(data_dir=args.data_dir)
+    catalog.logger.disabled = True
+    catalog.load()
+
+    if args.command == "encode":
+        orders = _read_json_orders(Path(args.source))
+        data = encode_orders(orders, catalog.skus)
+        Path(args.output).write_bytes(data)
+        print(f"Encoded {len(orders)} orders: "
+              f"{Path(args.source).stat().st_size} -> {len(data)} bytes")
+    elif args.command == "decode":
+        orders = decode_orders(Path(args.source).read_bytes(), catalog.skus, catalog.names)
+        print(json.dumps({'orders': {o['order_id']: o for o in orders}}, indent=2))
+    else:
+        orders = _read_json_orders(Path(args.source))
+        if args.order_id:
+            orders = [o for o in orders if o['order_id'] == args.order_id]
+            if not orders:
+                parser.error(f"Order {args.order_id} not in {args.source}")
+        print(to_barcode_text(encode_order(orders[0], catalog.skus)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,44 @@
 import json
 import logging
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
+from catalog import SkuCatalog
+import order_codec
 
 class OrderManager:
-    def __init__(self, data_dir: str = "data"):
+    def __init__(
+        self,
+        data_dir: str = "data",
+        pick_client=None,
+        station_id: str = "",
+        replica=None,
+        catalog: Optional[SkuCatalog] = None
+    ):
+        """
+        Args:
+            data_dir: Directory holding order and completion files
+            pick_client: Optional PickClient; when set, orders are claimed on
+                the shared pick server and picks are queued to its background
+                sender
+            station_id: Station recorded in completion data
+            replica: Optional OrderReplica; orders are looked up in it before
+                the data directory, and completions of orders loaded from it
+                are queued to it for sync
+            catalog: SKU catalog used to decode binary orders; loaded from
+                data_dir on first use if not given
+        """
         self.data_dir = Path(data_dir)
+        self.pick_client = pick_client
+        self.station_id = station_id
+        self.replica = replica
+        self.catalog = catalog
         self.current_order: Optional[Dict] = None
+        # Replica version of the current order, None if it came from elsewhere
+        self.current_version: Optional[int] = None
+        # Serializes pick updates and completion across scanning threads
+        self._lock = threading.Lock()
         self.setup_logging()
         
     def setup_logging(self):
@@ -19,30 +50,95 @@ class OrderManager:
         Load order data from barcode or file.
         
         Args:
-            order_code: Order identifier or barcode data
+            order_code: Order identifier, JSON barcode data or binary
+                barcode text (see order_codec)
             
         Returns:
             Dict containing order data
         """
-        try:
-            # Try parsing order code as JSON first
-            order_data = json.loads(order_code)
-        except json.JSONDecodeError:
-            # If not JSON, try loading from file
-            order_file = self.data_dir / f"{order_code}.json"
-            if not order_file.exists():
-                raise FileNotFoundError(f"Order {order_code} not found")
-                
-            with open(order_file) as f:
-                order_data = json.load(f)
+        if order_codec.is_barcode_text(order_code):
+            catalog = self._get_catalog()
+            order_data = order_codec.decode_order(
+                order_codec.from_barcode_text(order_code),
+                catalog.skus,
+                catalog.names
+            )
+            version = None
+        else:
+            order_data, version = self._load_order_data(order_code)
         
         self._validate_order_data(order_data)
+        picked_items = {}
+        if self.pick_client:
+            # Raises if another station holds the order
+            claim = self.pick_client.claim(order_data)
+            picked_items = claim['picked']
+            
         self.current_order = order_data
-        self.current_order['picked_items'] = {}
+        self.current_order['picked_items'] = picked_items
+        self.current_version = version
         self.logger.info(f"Loaded order {order_data['order_id']}")
         
         return order_data
         
+    def _load_order_data(self, order_code: str) -> Tuple[Dict, Optional[int]]:
+        """Return the order and its replica version (None if not from the replica)."""
+        try:
+            # Try parsing order code as JSON first
+            return json.loads(order_code), None
+        except json.JSONDecodeError:
+            pass
+            
+        # If not JSON, try the local replica, then loading from file
+        checkout = self.replica.checkout(order_code) if self.replica else None
+        if checkout is not None:
+            return checkout
+            
+        order_file = self.data_dir / f"{order_code}.json"
+        if order_file.exists():
+            with open(order_file) as f:
+                return json.load(f), None
+                
+        binary_file = self.data_dir / f"{order_code}{order_codec.FILE_SUFFIX}"
+        if binary_file.exists():
+            for order in self.load_orders_file(binary_file):
+                if order['order_id'] == order_code:
+                    return order, None
+            raise FileNotFoundError(f"Order {order_code} not in {binary_file}")
+            
+        raise FileNotFoundError(f"Order {order_code} not found")
+        
+    def _get_catalog(self) -> SkuCatalog:
+        if self.catalog is None:
+            self.catalog = SkuCatalog(data_dir=str(self.data_dir))
+        if not self.catalog.ready.is_set():
+            self.catalog.load()
+        return self.catalog
+        
+    def load_orders_file(self, path) -> List[Dict]:
+        """
+        Load every order in a bulk order file.
+        
+        Binary files (order_codec) are detected by their header; anything
+        else is read as JSON, either {"orders": {id: order}} or one order.
+        
+        Args:
+            path: Path to the order file
+            
+        Returns:
+            List of order dicts
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        if order_codec.is_encoded(data):
+            catalog = self._get_catalog()
+            return order_codec.decode_orders(data, catalog.skus, catalog.names)
+            
+        orders = json.loads(data)
+        if 'orders' in orders:
+            return list(orders['orders'].values())
+        return [orders]
+        
     def _validate_order_data(self, data: Dict) -> None:
         """Validate order data has required fields."""
         required_fields = ['order_id', 'items']
@@ -53,37 +149,45 @@ class OrderManager:
         if not data['items']:
             raise ValueError("Order contains no items")
             
-    def update_order(self, sku: str) -> Dict:
+    def update_order(self, sku: str, quantity: int = 1) -> Dict:
         """
         Mark an item as picked in the current order.
         
         Args:
             sku: SKU of picked item
+            quantity: Number of units picked
             
         Returns:
             Dict with updated item status
         """
-        if not self.current_order:
-            raise RuntimeError("No order currently loaded")
-            
-        # Find item in order
-        order_item = next(
-            (item for item in self.current_order['items'] 
-             if item['sku'] == sku),
-            None
-        )
-        
-        if not order_item:
-            raise ValueError(f"SKU {sku} not in current order")
+        # Checked under the lock so a racing completion cannot unload the
+        # order between the lookup and the update
+        with self._lock:
+            if not self.current_order:
+                raise RuntimeError("No order currently loaded")
+                
+            # Find item in order
+            order_item = next(
+                (item for item in self.current_order['items'] 
+                 if item['sku'] == sku),
+                None
+            )
             
-        # Update pick count
-        if sku not in self.current_order['picked_items']:
-            self.current_order['picked_items'][sku] = 0
-        self.current_order['picked_items'][sku] += 1
-        
-        picked_count = self.current_order['picked_items'][sku]
+            if not order_item:
+                raise ValueError(f"SKU {sku} not in current order")
+                
+            # Update pick count
+            order_id = self.current_order['order_id']
+            picked_items = self.current_order['picked_items']
+            picked_items[sku] = picked_items.get(sku, 0) + quantity
+            picked_count = picked_items[sku]
         required_count = order_item['quantity']
         
+        if self.pick_client:
+            self.pick_client.queue_pick(
+                order_id=order_id, sku=sku, quantity=quantity
+            )
+        
         self.logger.info(
             f"Updated {sku}: {picked_count}/{required_count} picked"
         )
@@ -118,29 +222,47 @@ class OrderManager:
         """
         Mark order as complete and save completion data.
         
+        Runs under the manager's lock, so concurrent calls complete the
+        order once; later calls find no order loaded.
+        
         Args:
             order_id: ID of order to complete
         """
-        if not self.current_order:
-            raise RuntimeError("No order currently loaded")
+        with self._lock:
+            if not self.current_order:
+                raise RuntimeError("No order currently loaded")
             
-        if self.current_order['order_id'] != order_id:
-            raise ValueError("Order ID mismatch")
+            if self.current_order['order_id'] != order_id:
+                raise ValueError("Order ID mismatch")
             
-        # Save completion data
-        completion_data = {
-            'order_id': order_id,
-            'completed_at': datetime.now().isoformat(),
-            'picked_items': self.current_order['picked_items']
-        }
+            if self.pick_client:
+                self.pick_client.complete(order_id)
+            
+            # Save completion data
+            required_items = {}
+            for item in self.current_order['items']:
+                required_items[item['sku']] = (
+                    required_items.get(item['sku'], 0) + item['quantity']
+                )
+            completion_data = {
+                'order_id': order_id,
+                'station': self.station_id,
+                'completed_at': datetime.now().isoformat(),
+                'required_items': required_items,
+                'picked_items': self.current_order['picked_items']
+            }
         
-        completion_file = (
-            self.data_dir / 
-            f"completed_{order_id}_{completion_data['completed_at']}.json"
-        )
+            completion_file = (
+                self.data_dir / 
+                f"completed_{order_id}_{completion_data['completed_at']}.json"
+            )
         
-        with open(completion_file, 'w') as f:
-            json.dump(completion_data, f, indent=2)
+            with open(completion_file, 'w') as f:
+                json.dump(completion_data, f, indent=2)
+            
+            if self.replica and self.current_version is not None:
+                self.replica.queue_completion(completion_data, self.current_version)
             
-        self.logger.info(f"Completed order {order_id}")
-        self.current_order = None
\ No newline at end of file
+            self.logger.info(f"Completed order {order_id}")
+            self.current_order = None
+            self.current_version = None
\ No newline at end of file
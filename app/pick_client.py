@@ -0,0 +1,304 @@
+import json
+import logging
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Dict, List, Optional
+
+from pick_server import DEFAULT_HOST, DEFAULT_PORT
+
+class PickClient:
+    """
+    Station-side client for the pick server.
+
+    Pick events are queued locally and sent in batches. Each event gets a
+    unique id when queued, so a batch that fails mid-flight is resent as-is
+    and the server ignores the events it already applied.
+
+    Once an order is claimed, a background sender thread flushes queued
+    picks when a batch fills or every `flush_interval` seconds, and renews
+    the lease of every claimed order about three times per lease period.
+    Queueing a pick never touches the network. Failures seen by the sender
+    are collected for the UI to show (see `take_errors`).
+    """
+
+    def __init__(
+        self,
+        station_id: str,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        batch_size: int = 20,
+        retries: int = 3,
+        timeout: float = 5.0,
+        flush_interval: float = 2.0
+    ):
+        self.station_id = station_id
+        self.host = host
+        self.port = port
+        self.batch_size = batch_size
+        self.retries = retries
+        self.timeout = timeout
+        self.flush_interval = flush_interval
+        self.pending: Dict[str, List[Dict]] = {}
+        # Claimed orders: order_id -> {'order', 'lease_seconds', 'contact'}
+        self.claims: Dict[str, Dict] = {}
+        self.errors: deque = deque(maxlen=20)
+        self.online = True
+        self._sock: Optional[socket.socket] = None
+        self._file = None
+        self._lock = threading.Lock()
+        self._request_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._sender: Optional[threading.Thread] = None
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def _connect(self):
+        self._sock = socket.create_connection(
+            (self.host, self.port), timeout=self.timeout
+        )
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self._sock.makefile('rb')
+
+    def _disconnect(self):
+        if self._sock:
+            self._file.close()
+            self._sock.close()
+        self._sock = None
+        self._file = None
+
+    def close(self):
+        """Stop the sender thread and drop the connection."""
+        self._stopped.set()
+        self._wake.set()
+        if self._sender and self._sender is not threading.current_thread():
+            self._sender.join(timeout=self.timeout)
+        with self._request_lock:
+            self._disconnect()
+
+    def _request(self, payload: Dict) -> Dict:
+        """
+        Send one request, reconnecting and retrying on connection errors.
+
+        Requests from the caller and the sender thread share one connection
+        and are sent one at a time.
+
+        Raises:
+            ConnectionError: If the server is unreachable after all retries
+            RuntimeError: If the server rejects the request
+        """
+        payload['station'] = self.station_id
+        data = json.dumps(payload).encode() + b"\n"
+        last_error = None
+        with self._request_lock:
+            for attempt in range(self.retries + 1):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    self._sock.sendall(data)
+                    line = self._file.readline()
+                    if not line:
+                        raise ConnectionError("Pick server closed connection")
+                    break
+                except OSError as e:
+                    last_error = e
+                    self.logger.warning(
+                        f"Pick server request failed (attempt {attempt + 1}): {e}"
+                    )
+                    self._disconnect()
+            else:
+                raise ConnectionError(f"Pick server unreachable: {last_error}")
+
+        response = json.loads(line)
+        if not response.pop('ok'):
+            raise RuntimeError(response['error'])
+        if payload['op'] in ('claim', 'renew', 'pick'):
+            # The server renewed the lease on this request
+            with self._lock:
+                claim = self.claims.get(payload['order_id'])
+                if claim:
+                    claim['contact'] = time.monotonic()
+        return response
+
+    def claim(self, order: Dict) -> Dict:
+        """
+        Claim an order for this station, registering it with the server.
+
+        Returns:
+            Dict with 'picked' counts already recorded on the server
+        """
+        order = {'order_id': order['order_id'], 'items': order['items']}
+        response = self._request({
+            'op': 'claim',
+            'order_id': order['order_id'],
+            'order': order
+        })
+        with self._lock:
+            self.claims[order['order_id']] = {
+                'order': order,
+                'lease_seconds': response['lease_seconds'],
+                'contact': time.monotonic()
+            }
+        self._start_sender()
+        return response
+
+    def renew(self, order_id: str) -> Dict:
+        return self._request({'op': 'renew', 'order_id': order_id})
+
+    def release(self, order_id: str) -> Dict:
+        with self._lock:
+            self.pending.pop(order_id, None)
+            self.claims.pop(order_id, None)
+        return self._request({'op': 'release', 'order_id': order_id})
+
+    def queue_pick(self, order_id: str, sku: str, quantity: int = 1) -> str:
+        """
+        Queue a pick event; the sender thread sends it.
+
+        Returns:
+            The event id assigned to the pick
+        """
+        event_id = uuid.uuid4().hex
+        with self._lock:
+            batch = self.pending.setdefault(order_id, [])
+            batch.append({'event_id': event_id, 'sku': sku, 'quantity': quantity})
+            full = len(batch) >= self.batch_size
+        if full:
+            self._wake.set()
+        return event_id
+
+    def flush(self, order_id: str) -> List[Dict]:
+        """
+        Send queued pick events for an order, `batch_size` events per request.
+
+        Events stay queued until the server acknowledges them, so a failed
+        flush can simply be called again; chunks already acknowledged are
+        not resent. Picks queued while a chunk is in flight are kept for
+        the next flush.
+
+        Returns:
+            Per-event results from the server
+        """
+        with self._lock:
+            batch = list(self.pending.get(order_id, ()))
+        results = []
+        for start in range(0, len(batch), self.batch_size):
+            chunk = batch[start:start + self.batch_size]
+            response = self._request({
+                'op': 'pick',
+                'order_id': order_id,
+                'events': chunk
+            })
+            sent = {event['event_id'] for event in chunk}
+            with self._lock:
+                remaining = [
+                    e for e in self.pending.get(order_id, ())
+                    if e['event_id'] not in sent
+                ]
+                if remaining:
+                    self.pending[order_id] = remaining
+                else:
+                    self.pending.pop(order_id, None)
+            results.extend(response['results'])
+        rejected = [r for r in results if not r['valid']]
+        for result in rejected:
+            self.logger.warning(f"Pick rejected by server: {result['message']}")
+        return results
+
+    def complete(self, order_id: str) -> Dict:
+        """Flush outstanding picks and mark the order complete on the server."""
+        self.flush(order_id)
+        response = self._request({'op': 'complete', 'order_id': order_id})
+        with self._lock:
+            self.claims.pop(order_id, None)
+        return response
+
+    def take_errors(self) -> List[str]:
+        """Return and clear failures reported by the sender thread."""
+        errors = []
+        while self.errors:
+            errors.append(self.errors.popleft())
+        return errors
+
+    def _report(self, message: str) -> None:
+        self.logger.warning(message)
+        self.errors.append(message)
+
+    def _start_sender(self):
+        if self._sender is None or not self._sender.is_alive():
+            self._stopped.clear()
+            self._sender = threading.Thread(target=self._run_sender, daemon=True)
+            self._sender.start()
+
+    def _run_sender(self):
+        while not self._stopped.is_set():
+            with self._lock:
+                leases = [c['lease_seconds'] / 3 for c in self.claims.values()]
+            self._wake.wait(min([self.flush_interval] + leases))
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            self.send_pending()
+
+    def send_pending(self) -> None:
+        """
+        Flush every order with queued picks and renew leases falling due.
+
+        Runs on the sender thread. A server that cannot be reached leaves
+        the picks queued for the next attempt. If the server no longer
+        recognizes this station's claim, the order is claimed again; if
+        another station has taken it, its queued picks are dropped so they
+        do not block later orders, and the error is reported.
+        """
+        now = time.monotonic()
+        with self._lock:
+            flush = [order_id for order_id, batch in self.pending.items() if batch]
+            renew = [
+                order_id for order_id, claim in self.claims.items()
+                if order_id not in flush
+                and now - claim['contact'] >= claim['lease_seconds'] / 3
+            ]
+        try:
+            for order_id in flush:
+                try:
+                    self.flush(order_id)
+                except RuntimeError as e:
+                    self._reclaim(order_id, e)
+            for order_id in renew:
+                try:
+                    self.renew(order_id)
+                except RuntimeError as e:
+                    self._reclaim(order_id, e)
+        except ConnectionError as e:
+            if self.online:
+                self._report(f"Pick server unreachable, picks will be resent: {e}")
+            self.online = False
+            return
+        if not self.online:
+            self.logger.info("Pick server reachable again")
+        self.online = True
+
+    def _reclaim(self, order_id: str, error: Exception) -> None:
+        with self._lock:
+            claim = self.claims.get(order_id)
+        if claim is None:
+            return
+        try:
+            self.claim(claim['order'])
+            self.logger.info(f"Reclaimed {order_id} after: {error}")
+        except RuntimeError as e:
+            with self._lock:
+                dropped = len(self.pending.pop(order_id, ()))
+                self.claims.pop(order_id, None)
+            self._report(
+                f"Lost claim on {order_id} ({e}); {dropped} picks not sent"
+            )
+
+    def status(self, order_id: str) -> Dict:
+        return self._request({'op': 'status', 'order_id': order_id})
@@ -0,0 +1,399 @@
+import logging
+import os
+import threading
+import time
+from array import array
+from enum import IntEnum
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+class EventType(IntEnum):
+    ORDER_LOADED = 0
+    SCAN_VALID = 1
+    SCAN_INVALID = 2
+    SCAN_DUPLICATE = 3
+    ORDER_COMPLETED = 4
+
+# Column name and array typecode. An event is a tuple in this order.
+COLUMNS = (
+    ('ts', 'd'),
+    ('type', 'B'),
+    ('station', 'H'),
+    ('picker', 'H'),
+    ('order', 'I'),
+    ('sku', 'I'),
+    ('quantity', 'i'),
+)
+# Columns holding ids into a string table; id 0 is the empty string
+STRING_COLUMNS = ('station', 'picker', 'order', 'sku')
+
+SEGMENT_GLOB = "pick_log_*.npz"
+
+class PickLog:
+    """
+    Append-only log of pick events stored as typed columns.
+
+    Events are appended to stdlib `array` columns, so recording a scan costs
+    a few appends and does not need NumPy. Strings (station, picker, order
+    and SKU) are dictionary-coded into per-log tables. NumPy is only imported
+    for saving, loading and rebuilding projections.
+
+    Projections subscribed to the log see each event as it is recorded and
+    can be rebuilt from the full columns in one vectorized pass. Recording
+    is serialized by a lock, so scans from several threads never interleave
+    within a row.
+    """
+
+    def __init__(self):
+        self.columns = {name: array(code) for name, code in COLUMNS}
+        self.tables: Dict[str, List[str]] = {k: [""] for k in STRING_COLUMNS}
+        self._ids: Dict[str, Dict[str, int]] = {k: {"": 0} for k in STRING_COLUMNS}
+        self.projections: List["Projection"] = []
+        self._saved = 0
+        self._lock = threading.Lock()
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def __len__(self) -> int:
+        return len(self.columns['ts'])
+
+    def intern(self, kind: str, value: str) -> int:
+        """Get the id for a string in one of the string tables, adding it if new."""
+        ids = self._ids[kind]
+        key = ids.get(value)
+        if key is None:
+            key = ids[value] = len(self.tables[kind])
+            self.tables[kind].append(value)
+        return key
+
+    def name(self, kind: str, key: int) -> str:
+        return self.tables[kind][key]
+
+    def record(
+        self,
+        event_type: EventType,
+        order_id: str,
+        sku: str = "",
+        quantity: int = 0,
+        station: str = "",
+        picker: str = "",
+        ts: Optional[float] = None
+    ) -> Tuple:
+        """
+        Append an event and feed it to subscribed projections.
+
+        Returns:
+            The event tuple, in COLUMNS order
+        """
+        with self._lock:
+            event = (
+                time.time() if ts is None else ts,
+                int(event_type),
+                self.intern('station', station),
+                self.intern('picker', picker or station),
+                self.intern('order', order_id),
+                self.intern('sku', sku),
+                quantity
+            )
+            for (name, _), value in zip(COLUMNS, event):
+                self.columns[name].append(value)
+            for projection in self.projections:
+                projection.apply(event)
+        return event
+
+    def subscribe(self, projection: "Projection") -> "Projection":
+        """Attach a projection, rebuilding it from events already logged."""
+        projection.rebuild(self)
+        self.projections.append(projection)
+        return projection
+
+    def as_arrays(self, start: int = 0) -> Dict:
+        """Copy the columns from `start` onwards into NumPy arrays."""
+        import numpy as np
+        return {
+            name: np.array(self.columns[name][start:], dtype=code)
+            for name, code in COLUMNS
+        }
+
+    def save_segment(self, directory) -> Optional[Path]:
+        """
+        Write events recorded since the last save as a new .npz segment.
+
+        Each segment carries its own string tables, so segments written by
+        different stations or processes can be merged by `load`. The file
+        is written under a temporary name and renamed into place, so a
+        reader never sees a partial segment.
+
+        Returns:
+            Path of the written segment, or None if there was nothing new
+        """
+        if self._saved == len(self):
+            return None
+        end = len(self)
+        path = Path(directory) / f"pick_log_{time.time_ns()}.npz"
+        tmp_path = path.with_suffix(".tmp")
+        self._write_segment(tmp_path, self._saved, end)
+        os.replace(tmp_path, path)
+        self.logger.info(f"Saved {end - self._saved} events to {path}")
+        self._saved = end
+        return path
+
+    def _write_segment(self, path: Path, start: int, end: int) -> None:
+        """
+        Write events [start, end) with string tables holding only the
+        entries those events use, ids remapped to match.
+        """
+        import numpy as np
+
+        arrays = {
+            name: np.array(self.columns[name][start:end], dtype=code)
+            for name, code in COLUMNS
+        }
+        for kind in STRING_COLUMNS:
+            used, codes = np.unique(arrays[kind], return_inverse=True)
+            arrays[kind] = codes.reshape(-1).astype(arrays[kind].dtype)
+            table = self.tables[kind]
+            arrays[f"table_{kind}"] = np.array(
+                [table[key] for key in used.tolist()], dtype=str
+            )
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+
+    def extend(self, arrays: Dict, tables: Dict[str, List[str]]) -> None:
+        """
+        Append columns coded against `tables`, remapping ids into this log.
+
+        Projections are not fed; subscribe or rebuild them afterwards.
+        """
+        import numpy as np
+
+        arrays = dict(arrays)
+        for kind in STRING_COLUMNS:
+            mapping = np.array(
+                [self.intern(kind, str(value)) for value in tables[kind]],
+                dtype=np.uint32
+            )
+            arrays[kind] = mapping[arrays[kind]]
+        for name, code in COLUMNS:
+            self.columns[name].frombytes(
+                np.ascontiguousarray(arrays[name], dtype=code).tobytes()
+            )
+
+    @classmethod
+    def load(cls, directory, compact: bool = False) -> "PickLog":
+        """
+        Load and merge all saved segments in a directory, oldest first.
+
+        Args:
+            directory: Directory holding the segments
+            compact: Replace the segments read with one merged segment, so
+                later loads open a single file
+        """
+        import numpy as np
+
+        log = cls()
+        paths = sorted(Path(directory).glob(SEGMENT_GLOB))
+        for path in paths:
+            with np.load(path) as segment:
+                tables = {k: segment[f"table_{k}"].tolist() for k in STRING_COLUMNS}
+                log.extend({name: segment[name] for name, _ in COLUMNS}, tables)
+        log._saved = len(log)
+        log.logger.info(f"Loaded {len(log)} events from {directory}")
+
+        if compact and len(paths) > 1:
+            # The merged segment takes the newest name so ordering is kept
+            tmp_path = paths[-1].with_suffix(".tmp")
+            log._write_segment(tmp_path, 0, len(log))
+            os.replace(tmp_path, paths[-1])
+            for path in paths[:-1]:
+                path.unlink()
+            log.logger.info(f"Compacted {len(paths)} segments into {paths[-1]}")
+        return log
+
+
+class Projection:
+    """
+    Read model derived from a PickLog.
+
+    `apply` updates the projection for a single event tuple and `rebuild`
+    recomputes it from the log's columns with vectorized operations.
+    """
+
+    def apply(self, event: Tuple) -> None:
+        raise NotImplementedError
+
+    def rebuild(self, log: PickLog) -> None:
+        raise NotImplementedError
+
+
+class OrderStateProjection(Projection):
+    """Current pick counts, load time and completion time per order."""
+
+    def __init__(self):
+        self.orders: Dict[int, Dict] = {}
+
+    def _order(self, key: int) -> Dict:
+        state = self.orders.get(key)
+        if state is None:
+            state = self.orders[key] = {
+                'loaded_at': None, 'completed_at': None, 'picked': {}
+            }
+        return state
+
+    def apply(self, event: Tuple) -> None:
+        ts, event_type, _, _, order, sku, quantity = event
+        if event_type == EventType.ORDER_LOADED:
+            state = self._order(order)
+            if state['loaded_at'] is None:
+                state['loaded_at'] = ts
+        elif event_type == EventType.SCAN_VALID:
+            picked = self._order(order)['picked']
+            picked[sku] = picked.get(sku, 0) + quantity
+        elif event_type == EventType.ORDER_COMPLETED:
+            self._order(order)['completed_at'] = ts
+
+    def rebuild(self, log: PickLog) -> None:
+        import numpy as np
+
+        self.orders = {}
+        cols = log.as_arrays()
+        types = cols['type']
+
+        loaded = types == EventType.ORDER_LOADED
+        orders, first = np.unique(cols['order'][loaded], return_index=True)
+        for key, ts in zip(orders.tolist(), cols['ts'][loaded][first].tolist()):
+            self._order(key)['loaded_at'] = ts
+
+        completed = np.flatnonzero(types == EventType.ORDER_COMPLETED)
+        for key, ts in zip(cols['order'][completed].tolist(),
+                           cols['ts'][completed].tolist()):
+            self._order(key)['completed_at'] = ts
+
+        valid = types == EventType.SCAN_VALID
+        pairs = (cols['order'][valid].astype(np.uint64) << np.uint64(32)) | \
+            cols['sku'][valid]
+        keys, inverse = np.unique(pairs, return_inverse=True)
+        totals = np.bincount(inverse, weights=cols['quantity'][valid])
+        for pair, total in zip(keys.tolist(), totals.tolist()):
+            self._order(pair >> 32)['picked'][pair & 0xFFFFFFFF] = int(total)
+
+    def report(self, log: PickLog) -> Dict[str, Dict]:
+        """Order state keyed by order id, with dwell time in seconds."""
+        report = {}
+        for key, state in self.orders.items():
+            dwell = None
+            if state['loaded_at'] is not None and state['completed_at'] is not None:
+                dwell = state['completed_at'] - state['loaded_at']
+            report[log.name('order', key)] = {
+                'picked': {log.name('sku', s): n for s, n in state['picked'].items()},
+                'complete': state['completed_at'] is not None,
+                'dwell_seconds': dwell
+            }
+        return report
+
+
+class PickerRateProjection(Projection):
+    """Scan counts and active time span per picker."""
+
+    def __init__(self):
+        # picker id -> [units picked, valid, invalid, duplicate, first ts, last ts]
+        self.pickers: Dict[int, List] = {}
+
+    def apply(self, event: Tuple) -> None:
+        ts, event_type, _, picker, _, _, quantity = event
+        if event_type not in (EventType.SCAN_VALID, EventType.SCAN_INVALID,
+                              EventType.SCAN_DUPLICATE):
+            return
+        stats = self.pickers.get(picker)
+        if stats is None:
+            stats = self.pickers[picker] = [0, 0, 0, 0, ts, ts]
+        if event_type == EventType.SCAN_VALID:
+            stats[0] += quantity
+        stats[event_type] += 1
+        stats[4] = min(stats[4], ts)
+        stats[5] = max(stats[5], ts)
+
+    def rebuild(self, log: PickLog) -> None:
+        import numpy as np
+
+        cols = log.as_arrays()
+        types = cols['type']
+        scans = (types >= EventType.SCAN_VALID) & (types <= EventType.SCAN_DUPLICATE)
+        pickers = cols['picker'][scans]
+        types = types[scans]
+        ts = cols['ts'][scans]
+        size = len(log.tables['picker'])
+
+        units = np.bincount(
+            pickers, weights=cols['quantity'][scans] * (types == EventType.SCAN_VALID),
+            minlength=size
+        )
+        counts = np.zeros((4, size), dtype=np.int64)
+        np.add.at(counts, (types, pickers), 1)
+        first = np.full(size, np.inf)
+        last = np.full(size, -np.inf)
+        np.minimum.at(first, pickers, ts)
+        np.maximum.at(last, pickers, ts)
+
+        self.pickers = {
+            key: [int(units[key]), int(counts[1, key]), int(counts[2, key]),
+                  int(counts[3, key]), float(first[key]), float(last[key])]
+            for key in np.unique(pickers).tolist()
+        }
+
+    def report(self, log: PickLog) -> Dict[str, Dict]:
+        """Picks per hour and error rate keyed by picker."""
+        report = {}
+        for key, (units, valid, invalid, duplicate, first, last) in self.pickers.items():
+            hours = (last - first) / 3600
+            scans = valid + invalid + duplicate
+            report[log.name('picker', key)] = {
+                'units_picked': units,
+                'scans': scans,
+                'picks_per_hour': units / hours if hours > 0 else None,
+                'error_rate': (invalid + duplicate) / scans
+            }
+        return report
+
+
+class SkuErrorProjection(Projection):
+    """Invalid and duplicate scan counts per SKU."""
+
+    def __init__(self):
+        # sku id -> [invalid, duplicate]
+        self.errors: Dict[int, List[int]] = {}
+
+    def apply(self, event: Tuple) -> None:
+        event_type, sku = event[1], event[5]
+        if event_type == EventType.SCAN_INVALID:
+            self.errors.setdefault(sku, [0, 0])[0] += 1
+        elif event_type == EventType.SCAN_DUPLICATE:
+            self.errors.setdefault(sku, [0, 0])[1] += 1
+
+    def rebuild(self, log: PickLog) -> None:
+        import numpy as np
+
+        cols = log.as_arrays()
+        size = len(log.tables['sku'])
+        invalid = np.bincount(
+            cols['sku'][cols['type'] == EventType.SCAN_INVALID], minlength=size
+        )
+        duplicate = np.bincount(
+            cols['sku'][cols['type'] == EventType.SCAN_DUPLICATE], minlength=size
+        )
+        self.errors = {
+            key: [int(invalid[key]), int(duplicate[key])]
+            for key in np.flatnonzero(invalid + duplicate).tolist()
+        }
+
+    def hot_spots(self, log: PickLog, limit: int = 10) -> List[Dict]:
+        """SKUs with the most scan errors, worst first."""
+        ranked = sorted(self.errors.items(), key=lambda e: -sum(e[1]))[:limit]
+        return [
+            {'sku': log.name('sku', key), 'invalid': invalid,
+             'duplicate': duplicate}
+            for key, (invalid, duplicate) in ranked
+        ]
@@ -0,0 +1,244 @@
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+LEASE_SECONDS = 30.0
+# Longest request line accepted; claims carry the whole order
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+class PickServer:
+    """
+    Owns order state shared by all picking stations.
+
+    A station must claim an order before picking it. A claim is a lease that
+    expires after `lease_seconds` unless renewed; any request from the claim
+    holder renews it. Pick events carry a client-generated `event_id` so a
+    batch can be retried after a lost response without double counting.
+
+    Protocol: newline-delimited JSON over TCP, one response line per request.
+    Every request has an `op` key; every response has `ok` and either the
+    result fields or `error`.
+    """
+
+    def __init__(
+        self,
+        lease_seconds: float = LEASE_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.lease_seconds = lease_seconds
+        self.clock = clock
+        self.orders: Dict[str, Dict] = {}
+        self.claims: Dict[str, Dict] = {}
+        self.setup_logging()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def handle(self, request: Dict) -> Dict:
+        """
+        Dispatch a single protocol request.
+
+        Args:
+            request: Dict with an 'op' key and op-specific fields
+
+        Returns:
+            Response dict with 'ok' set
+        """
+        handler = getattr(self, f"op_{request.get('op')}", None)
+        if handler is None:
+            return {"ok": False, "error": f"Unknown op: {request.get('op')}"}
+        try:
+            response = handler(request)
+        except (KeyError, ValueError, RuntimeError) as e:
+            return {"ok": False, "error": str(e)}
+        response["ok"] = True
+        return response
+
+    def _register_order(self, order: Dict) -> Dict:
+        if not order.get('items'):
+            raise ValueError("Order contains no items")
+        state = {
+            'order_id': order['order_id'],
+            'required': {},
+            'picked': {},
+            'events': {},
+            'complete': False
+        }
+        for item in order['items']:
+            state['required'][item['sku']] = (
+                state['required'].get(item['sku'], 0) + item['quantity']
+            )
+        self.orders[order['order_id']] = state
+        return state
+
+    def _check_claim(self, order_id: str, station: str) -> Dict:
+        """Verify `station` holds the claim on `order_id` and renew its lease."""
+        claim = self.claims.get(order_id)
+        now = self.clock()
+        if not claim or claim['expires'] <= now:
+            raise RuntimeError(f"Order {order_id} is not claimed by {station}")
+        if claim['station'] != station:
+            raise RuntimeError(
+                f"Order {order_id} is claimed by {claim['station']}"
+            )
+        claim['expires'] = now + self.lease_seconds
+        return self.orders[order_id]
+
+    def op_claim(self, request: Dict) -> Dict:
+        order_id = request['order_id']
+        station = request['station']
+        state = self.orders.get(order_id)
+        if state is None:
+            if 'order' not in request:
+                raise ValueError(f"Order {order_id} not found")
+            state = self._register_order(request['order'])
+        if state['complete']:
+            raise RuntimeError(f"Order {order_id} already completed")
+
+        now = self.clock()
+        claim = self.claims.get(order_id)
+        if claim and claim['expires'] > now and claim['station'] != station:
+            raise RuntimeError(
+                f"Order {order_id} is claimed by {claim['station']}"
+            )
+
+        self.claims[order_id] = {
+            'station': station,
+            'expires': now + self.lease_seconds
+        }
+        self.logger.info(f"Order {order_id} claimed by {station}")
+        return {
+            'order_id': order_id,
+            'lease_seconds': self.lease_seconds,
+            'picked': dict(state['picked'])
+        }
+
+    def op_renew(self, request: Dict) -> Dict:
+        self._check_claim(request['order_id'], request['station'])
+        return {'order_id': request['order_id'], 'lease_seconds': self.lease_seconds}
+
+    def op_release(self, request: Dict) -> Dict:
+        self._check_claim(request['order_id'], request['station'])
+        del self.claims[request['order_id']]
+        return {'order_id': request['order_id']}
+
+    def op_pick(self, request: Dict) -> Dict:
+        """
+        Apply a batch of pick events to a claimed order.
+
+        Each event is {'event_id', 'sku', 'quantity'}. Events already seen are
+        answered with their original result, so resending a batch is safe.
+        """
+        state = self._check_claim(request['order_id'], request['station'])
+        required = state['required']
+        picked = state['picked']
+        events = state['events']
+
+        results = []
+        for event in request['events']:
+            event_id = event['event_id']
+            if event_id in events:
+                results.append(events[event_id])
+                continue
+
+            sku = event['sku']
+            quantity = event.get('quantity', 1)
+            if sku not in required:
+                result = {'event_id': event_id, 'valid': False,
+                          'message': f"SKU {sku} not in order"}
+            elif picked.get(sku, 0) + quantity > required[sku]:
+                result = {'event_id': event_id, 'valid': False,
+                          'message': f"Required quantity for {sku} already picked"}
+            else:
+                picked[sku] = picked.get(sku, 0) + quantity
+                result = {'event_id': event_id, 'valid': True,
+                          'picked': picked[sku]}
+            events[event_id] = result
+            results.append(result)
+
+        return {'order_id': state['order_id'], 'results': results}
+
+    def op_complete(self, request: Dict) -> Dict:
+        """
+        Mark a claimed order complete and release its claim.
+
+        Completing again from the station that completed the order succeeds,
+        so a request resent after a lost response is not rejected.
+        """
+        state = self.orders.get(request['order_id'])
+        if state and state['complete'] and state.get('completed_by') == request['station']:
+            return {'order_id': state['order_id'], 'picked': dict(state['picked'])}
+        state = self._check_claim(request['order_id'], request['station'])
+        state['complete'] = True
+        state['completed_by'] = request['station']
+        del self.claims[request['order_id']]
+        self.logger.info(f"Order {state['order_id']} completed")
+        return {'order_id': state['order_id'], 'picked': dict(state['picked'])}
+
+    def op_status(self, request: Dict) -> Dict:
+        state = self.orders.get(request['order_id'])
+        if state is None:
+            raise ValueError(f"Order {request['order_id']} not found")
+        claim = self.claims.get(request['order_id'])
+        claimed_by = None
+        if claim and claim['expires'] > self.clock():
+            claimed_by = claim['station']
+        return {
+            'order_id': state['order_id'],
+            'picked': dict(state['picked']),
+            'complete': state['complete'],
+            'claimed_by': claimed_by
+        }
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = self.handle(json.loads(line))
+                except json.JSONDecodeError:
+                    response = {"ok": False, "error": "Invalid JSON request"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        started: Optional[Callable] = None
+    ):
+        """Serve until cancelled. `started` is called with the bound server."""
+        server = await asyncio.start_server(
+            self.handle_connection, host, port, limit=MAX_REQUEST_BYTES
+        )
+        self.logger.info(f"Pick server listening on {host}:{port}")
+        if started:
+            started(server)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Multi-station pick server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--lease", type=float, default=LEASE_SECONDS,
+                        help="claim lease in seconds")
+    args = parser.parse_args(argv)
+    asyncio.run(PickServer(lease_seconds=args.lease).serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
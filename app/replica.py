@@ -0,0 +1,259 @@
+import bisect
+import json
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+class LocalFeed:
+    """
+    Local stand-in for the order feed a zone's stations sync against.
+
+    Every publish or cancel gets the next sequence number. `changes_since`
+    returns only the latest change per order after a given sequence, so a
+    station that reconnects transfers the delta, not the full order set.
+    `online` can be cleared to simulate losing the network.
+
+    A real feed exposes the same two calls over the network:
+        changes_since(seq, zone) -> {'seq': int, 'changes': [change, ...]}
+        submit_completions([completion, ...]) -> [result, ...]
+    """
+
+    def __init__(self):
+        self.seq = 0
+        self.log: List[Dict] = []
+        self.orders: Dict[str, Dict] = {}
+        self.completions: Dict[str, Dict] = {}
+        self.online = True
+
+    def _check_online(self):
+        if not self.online:
+            raise ConnectionError("Order feed unreachable")
+
+    def publish(self, order: Dict, zone: str = "default") -> int:
+        """Add or change an order; returns its new version (sequence number)."""
+        self.seq += 1
+        self.orders[order['order_id']] = {
+            'order': order, 'zone': zone, 'version': self.seq, 'cancelled': False
+        }
+        self.log.append({
+            'seq': self.seq, 'op': 'upsert', 'zone': zone,
+            'order_id': order['order_id'], 'order': order
+        })
+        return self.seq
+
+    def cancel(self, order_id: str) -> int:
+        entry = self.orders[order_id]
+        self.seq += 1
+        entry['version'] = self.seq
+        entry['cancelled'] = True
+        self.log.append({
+            'seq': self.seq, 'op': 'cancel', 'zone': entry['zone'],
+            'order_id': order_id
+        })
+        return self.seq
+
+    def changes_since(self, seq: int, zone: str = "default") -> Dict:
+        self._check_online()
+        start = bisect.bisect_right([c['seq'] for c in self.log], seq)
+        latest = {}
+        for change in self.log[start:]:
+            if change['zone'] == zone:
+                latest[change['order_id']] = change
+        return {
+            'seq': self.seq,
+            'changes': sorted(latest.values(), key=lambda c: c['seq'])
+        }
+
+    def submit_completions(self, completions: List[Dict]) -> List[Dict]:
+        """
+        Accept completions, flagging ones that conflict with feed state.
+
+        A completion conflicts if its order is unknown, was cancelled or
+        changed after the version the station picked, or was completed by a
+        different submission. Resubmitting the same completion is accepted.
+        """
+        self._check_online()
+        results = []
+        for completion in completions:
+            order_id = completion['order_id']
+            entry = self.orders.get(order_id)
+            existing = self.completions.get(order_id)
+            reason = None
+            if existing is not None:
+                if existing['completion_id'] != completion['completion_id']:
+                    reason = "Order already completed"
+            elif entry is None:
+                reason = "Unknown order"
+            elif entry['cancelled']:
+                reason = "Order cancelled"
+            elif entry['version'] != completion['version']:
+                reason = "Order changed since it was picked"
+
+            if reason is None:
+                self.completions[order_id] = completion
+            results.append({
+                'completion_id': completion['completion_id'],
+                'order_id': order_id,
+                'status': 'conflict' if reason else 'accepted',
+                'reason': reason
+            })
+        return results
+
+
+class OrderReplica:
+    """
+    Station-local copy of a zone's assigned orders.
+
+    Reads never touch the network: `get_order` answers from the replica.
+    `sync` pulls changes after the last seen sequence number and pushes
+    queued completions; if the feed is unreachable the replica keeps
+    working from local state and the outbox waits for the next sync.
+    State is persisted to a JSON file so it survives restarts.
+
+    A station loads an order with `checkout`, which also returns the
+    version it is picking against, and passes that version back to
+    `queue_completion`; a change pulled mid-pick then shows up as a
+    conflict on the feed. Conflicts are kept until the station has shown
+    them (see `take_conflicts`), including across restarts.
+    """
+
+    def __init__(self, feed, data_dir: str = "data", zone: str = "default"):
+        self.feed = feed
+        self.zone = zone
+        self.path = Path(data_dir) / f"replica_{zone}.json"
+        self.seq = 0
+        self.orders: Dict[str, Dict] = {}
+        self.outbox: List[Dict] = []
+        self.conflicts: List[Dict] = []
+        # Number of conflicts already handed out by take_conflicts
+        self.reported = 0
+        self.online = False
+        self._lock = threading.Lock()
+        self.setup_logging()
+        self._load()
+
+    def setup_logging(self):
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            state = json.load(f)
+        self.seq = state['seq']
+        self.orders = state['orders']
+        self.outbox = state['outbox']
+        self.conflicts = state['conflicts']
+        self.reported = state.get('reported', len(self.conflicts))
+
+    def _save(self):
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'seq': self.seq,
+                'orders': self.orders,
+                'outbox': self.outbox,
+                'conflicts': self.conflicts,
+                'reported': self.reported
+            }, f)
+        os.replace(tmp_path, self.path)
+
+    def get_order(self, order_id: str) -> Optional[Dict]:
+        """Return a copy of an assigned order, or None if not in the replica."""
+        checkout = self.checkout(order_id)
+        return checkout[0] if checkout else None
+
+    def checkout(self, order_id: str) -> Optional[Tuple[Dict, int]]:
+        """
+        Get a copy of an assigned order and the version it is at.
+
+        Returns:
+            (order, version), or None if the order is not in the replica
+        """
+        with self._lock:
+            entry = self.orders.get(order_id)
+            if entry is None:
+                return None
+            return json.loads(json.dumps(entry['order'])), entry['version']
+
+    def queue_completion(self, completion: Dict, version: int) -> Dict:
+        """
+        Queue completion data for upload and drop the order locally.
+
+        Args:
+            completion: Completion data with 'order_id'
+            version: Order version from `checkout` when picking started, so
+                the feed can detect changes made while the order was picked
+        """
+        with self._lock:
+            self.orders.pop(completion['order_id'], None)
+            queued = dict(completion)
+            queued['completion_id'] = uuid.uuid4().hex
+            queued['version'] = version
+            self.outbox.append(queued)
+            self._save()
+        return queued
+
+    def take_conflicts(self) -> List[Dict]:
+        """Return conflicts recorded since the last call, marking them shown."""
+        with self._lock:
+            conflicts = self.conflicts[self.reported:]
+            if conflicts:
+                self.reported = len(self.conflicts)
+                self._save()
+        return conflicts
+
+    def sync(self) -> Dict:
+        """
+        Pull order changes and push queued completions.
+
+        Network calls are made without holding the replica lock, so picking
+        and queueing completions never wait on the feed.
+
+        Returns:
+            Dict with counts of 'pulled' changes and 'pushed' completions,
+            new 'conflicts', and whether the feed was 'online'
+        """
+        summary = {'pulled': 0, 'pushed': 0, 'conflicts': [], 'online': True}
+        try:
+            delta = self.feed.changes_since(self.seq, self.zone)
+            with self._lock:
+                for change in delta['changes']:
+                    if change['op'] == 'cancel':
+                        self.orders.pop(change['order_id'], None)
+                    else:
+                        self.orders[change['order_id']] = {
+                            'order': change['order'], 'version': change['seq']
+                        }
+                self.seq = delta['seq']
+                pending = list(self.outbox)
+            summary['pulled'] = len(delta['changes'])
+
+            if pending:
+                results = self.feed.submit_completions(pending)
+                sent = {r['completion_id'] for r in results}
+                conflicts = [r for r in results if r['status'] == 'conflict']
+                with self._lock:
+                    self.outbox = [
+                        c for c in self.outbox if c['completion_id'] not in sent
+                    ]
+                    self.conflicts.extend(conflicts)
+                summary['pushed'] = len(results)
+                summary['conflicts'] = conflicts
+        except ConnectionError as e:
+            summary['online'] = False
+            self.logger.warning(f"Order sync deferred: {str(e)}")
+
+        with self._lock:
+            self.online = summary['online']
+            self._save()
+
+        for conflict in summary['conflicts']:
+            self.logger.warning(
+                f"Completion conflict on {conflict['order_id']}: {conflict['reason']}"
+            )
+        return summary
@@ -0,0 +1,108 @@
+import re
+from typing import Optional
+
+UNIT_GRAMS = {"g": 1.0, "kg": 1000.0, "lb": 453.59237, "oz": 28.349523125}
+
+def count_from_weight(
+    weight: float,
+    unit_weight: float,
+    tare: float = 0.0,
+    tolerance: float = 0.25
+) -> int:
+    """
+    Convert a net scale reading into a unit count.
+
+    Args:
+        weight: Gross weight in grams
+        unit_weight: Weight of one unit in grams
+        tare: Container weight in grams
+        tolerance: Allowed deviation from a whole count, as a fraction of
+            one unit
+
+    Returns:
+        Number of units on the scale
+
+    Raises:
+        ValueError: If the reading is not close enough to a whole count
+    """
+    if unit_weight <= 0:
+        raise ValueError("Unit weight must be positive")
+    units = (weight - tare) / unit_weight
+    count = round(units)
+    if count < 1 or abs(units - count) > tolerance:
+        raise ValueError(
+            f"Weight {weight:.1f} g does not match a whole count "
+            f"of {unit_weight:.1f} g units"
+        )
+    return count
+
+
+class StandInScale:
+    """
+    Local stand-in for a counting scale.
+
+    Weights are set by the caller, or read from a text file holding the
+    current reading in grams, so count-by-weight can be exercised without
+    hardware.
+    """
+
+    def __init__(self, weight: float = 0.0, reading_file: Optional[str] = None):
+        self.weight = weight
+        self.reading_file = reading_file
+
+    def set_weight(self, weight: float) -> None:
+        self.weight = weight
+
+    def read_weight(self) -> float:
+        """Return the current reading in grams."""
+        if self.reading_file:
+            with open(self.reading_file) as f:
+                return float(f.read().strip())
+        return self.weight
+
+
+class SerialScale:
+    """
+    Counting scale on a serial port.
+
+    Sends the weigh command and parses replies such as "  1.234 kg". Needs
+    the optional pyserial package.
+    """
+
+    READING = re.compile(r"([-+]?\d+(?:\.\d+)?)\s*(kg|g|lb|oz)", re.IGNORECASE)
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 9600,
+        command: bytes = b"W\r",
+        timeout: float = 1.0
+    ):
+        try:
+            import serial
+        except ImportError:
+            raise RuntimeError("pyserial is required for serial scales")
+        self.command = command
+        self.connection = serial.Serial(port, baudrate=baudrate, timeout=timeout)
+
+    def read_weight(self) -> float:
+        """
+        Request a reading and return it in grams.
+
+        Raises:
+            RuntimeError: If the scale does not reply with a weight
+        """
+        self.connection.reset_input_buffer()
+        self.connection.write(self.command)
+        reply = self.connection.readline().decode("ascii", errors="replace")
+        return self.parse_reading(reply)
+
+    @classmethod
+    def parse_reading(cls, reply: str) -> float:
+        match = cls.READING.search(reply)
+        if not match:
+            raise RuntimeError(f"Unreadable scale reply: {reply!r}")
+        return float(match.group(1)) * UNIT_GRAMS[match.group(2).lower()]
+
+    def close(self) -> None:
+        self.connection.close()
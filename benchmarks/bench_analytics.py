@@ -0,0 +1,72 @@
+"""
+Shift analytics benchmark over a month of synthetic completion data.
+
+Usage:
+    python benchmarks/bench_analytics.py [--lines N]
+
+Builds ShiftData columns for N order lines (default 5M, about a month for
+40 stations) and times each metric and a cache save/load round trip. JSON
+parsing is excluded: it is paid once per file when the cache is extended.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from analytics import ShiftAnalytics, ShiftData  # noqa: E402
+
+
+def synthetic_data(n, rng):
+    orders = np.arange(n, dtype=np.uint32) // 5
+    required = rng.integers(1, 20, size=n, dtype=np.int32)
+    short = rng.random(n) < 0.02
+    columns = {
+        'order': orders,
+        'station': rng.integers(0, 40, size=n, dtype=np.uint16),
+        'sku': rng.zipf(1.3, size=n).clip(max=20000).astype(np.uint32) - 1,
+        'required': required,
+        'picked': np.where(short, required // 2, required).astype(np.int32),
+        'completed_at': 1_710_000_000 + orders * (30 * 86400 / (n // 5)),
+    }
+    tables = {
+        'order': [f"ORD{i:07d}" for i in range(n // 5 + 1)],
+        'station': [f"ST{i:02d}" for i in range(40)],
+        'sku': [f"SKU{i:05d}" for i in range(20000)],
+    }
+    return ShiftData(columns, tables, [])
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label}: {(time.perf_counter() - start) * 1000:.0f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=5_000_000)
+    args = parser.parse_args()
+
+    data = synthetic_data(args.lines, np.random.default_rng(0))
+    analytics = ShiftAnalytics(data)
+    print(f"{args.lines:,} order lines:")
+    start = time.perf_counter()
+    timed("short_picks", analytics.short_picks)
+    timed("throughput_per_hour", analytics.throughput_per_hour)
+    timed("sku_velocity", analytics.sku_velocity)
+    print(f"  total: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "cache.npz"
+        timed("save cache", lambda: data.save(path))
+        timed("load cache", lambda: ShiftData.load(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Concurrent scan load generator.
+
+Usage:
+    python benchmarks/bench_concurrent_picks.py [--orders N] [--cameras N]
+        [--lines N] [--quantity N] [--seed N]
+
+Drives the matcher, order manager and pick log the way a multi-camera
+station does: for each order, several threads scan random SKUs (including
+ones not on the order and over-quantity counts) until the order is picked,
+then every thread races to complete it. After each order the invariants
+are checked: no line over-picked, one completion signal, one completion
+file, and matcher, order manager and journal totals all equal. Reports
+scans per second.
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from matcher import ItemMatcher  # noqa: E402
+from order_manager import OrderManager  # noqa: E402
+from pick_log import EventType, OrderStateProjection, PickLog  # noqa: E402
+
+
+def run_order(order, matcher, manager, log, cameras, rng_seed):
+    order_id = order["order_id"]
+    manager.load_order(json.dumps(order))
+    matcher.load_order_items(order["items"])
+    log.record(EventType.ORDER_LOADED, order_id)
+    skus = [item["sku"] for item in order["items"]] + ["UNKNOWN"]
+    signals = []
+    scans = []
+    completions = []
+    done = threading.Event()
+
+    def camera(index):
+        rng = random.Random(rng_seed + index)
+        count = 0
+        while not done.is_set():
+            sku = rng.choice(skus)
+            quantity = rng.choice((1, 1, 1, 2, 5))
+            count += 1
+            result = matcher.pick_quantity(sku, quantity, order)
+            if result["valid"]:
+                manager.update_order(sku, quantity)
+                log.record(EventType.SCAN_VALID, order_id, sku, quantity,
+                           station=f"CAM{index}")
+            elif sku in matcher.current_items:
+                log.record(EventType.SCAN_DUPLICATE, order_id, sku, quantity,
+                           station=f"CAM{index}")
+            else:
+                log.record(EventType.SCAN_INVALID, order_id, sku,
+                           station=f"CAM{index}")
+            if result["order_complete"]:
+                signals.append(index)
+                done.set()
+        scans.append(count)
+
+    def complete(index):
+        try:
+            manager.complete_order(order_id)
+            completions.append(index)
+        except RuntimeError:
+            pass
+
+    for target in (camera, complete):
+        threads = [threading.Thread(target=target, args=(i,)) for i in range(cameras)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    picked = {sku: item.quantity_picked for sku, item in matcher.current_items.items()}
+    required = {item["sku"]: item["quantity"] for item in order["items"]}
+    assert picked == required, f"{order_id}: picked {picked}, required {required}"
+    assert len(signals) == 1, f"{order_id}: {len(signals)} completion signals"
+    assert len(completions) == 1, f"{order_id}: completed {len(completions)} times"
+    log.record(EventType.ORDER_COMPLETED, order_id)
+    matcher.reset()
+    return sum(scans)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=200)
+    parser.add_argument("--cameras", type=int, default=4)
+    parser.add_argument("--lines", type=int, default=10)
+    parser.add_argument("--quantity", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    catalog = [f"SKU{i:05d}" for i in range(1000)]
+    orders = [
+        {
+            "order_id": f"LOAD{n:05d}",
+            "items": [{"sku": sku, "quantity": rng.randint(1, args.quantity)}
+                      for sku in rng.sample(catalog, args.lines)]
+        }
+        for n in range(args.orders)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        matcher = ItemMatcher()
+        manager = OrderManager(data_dir=tmp_dir)
+        log = PickLog()
+        projection = log.subscribe(OrderStateProjection())
+        for component in (matcher, manager, log):
+            component.logger.disabled = True
+
+        total = 0
+        start = time.perf_counter()
+        for n, order in enumerate(orders):
+            total += run_order(order, matcher, manager, log, args.cameras,
+                               args.seed + n * args.cameras)
+        elapsed = time.perf_counter() - start
+
+        completion_files = list(Path(tmp_dir).glob("completed_*.json"))
+        assert len(completion_files) == len(orders)
+        report = projection.report(log)
+        for path in completion_files:
+            with open(path) as f:
+                completion = json.load(f)
+            journal = report[completion["order_id"]]
+            assert journal["complete"]
+            assert journal["picked"] == completion["picked_items"], completion["order_id"]
+
+    print(f"{args.orders} orders, {args.cameras} cameras: {total} scans in "
+          f"{elapsed:.2f} s, {total / elapsed:,.0f} scans/s; invariants held")
+
+
+if __name__ == "__main__":
+    main()
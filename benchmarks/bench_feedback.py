@@ -0,0 +1,73 @@
+"""
+Scan turnaround benchmark: success path versus error path.
+
+Usage:
+    python benchmarks/bench_feedback.py [--scans N]
+
+Builds the app, loads a large order and times process_scan plus the
+resulting redraw for valid SKUs and for SKUs not in the order. Errors are
+shown as non-blocking banners, so both paths should return in comparable
+time. Needs a display; exits non-zero if the error path is more than
+ERROR_PATH_BUDGET times slower than the success path.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+ERROR_PATH_BUDGET = 3.0
+
+
+def time_scans(app, codes):
+    timings = []
+    for code in codes:
+        start = time.perf_counter()
+        app.process_scan(code)
+        app.root.update_idletasks()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scans", type=int, default=500)
+    args = parser.parse_args()
+
+    if sys.platform != "darwin" and not os.environ.get("DISPLAY"):
+        print("skipped (no display)")
+        return 0
+
+    from debouncer import ScanDebouncer
+    from main import WarehousePickingApp
+
+    app = WarehousePickingApp()
+    app.logger.disabled = True
+    # Every read is a fresh scan for this benchmark
+    app.debouncer = ScanDebouncer(hold_off=0, rearm_gap=0)
+    app.display.cue_handlers.clear()
+    order = {
+        "order_id": "BENCH001",
+        "items": [{"sku": f"SKU{i:04d}", "quantity": args.scans} for i in range(200)]
+    }
+    app.process_scan(json.dumps(order))
+
+    valid = time_scans(app, [f"SKU{i % 200:04d}" for i in range(args.scans)])
+    invalid = time_scans(app, [f"BAD{i:04d}" for i in range(args.scans)])
+    app.root.destroy()
+
+    valid_ms = statistics.median(valid)
+    invalid_ms = statistics.median(invalid)
+    print(f"success path: median {valid_ms:.3f} ms, max {max(valid):.3f} ms")
+    print(f"error path:   median {invalid_ms:.3f} ms, max {max(invalid):.3f} ms")
+    ratio = invalid_ms / valid_ms
+    print(f"error/success: {ratio:.2f}x (budget {ERROR_PATH_BUDGET}x)")
+    return 1 if ratio > ERROR_PATH_BUDGET else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Order encoding benchmark: size and load time, binary versus JSON.
+
+Usage:
+    python benchmarks/bench_order_codec.py [--orders N]
+
+Reports barcode text length for the sample orders, then encodes a bulk file
+of N synthetic orders both ways and compares file size and decode time.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "app"))
+
+import order_codec  # noqa: E402
+from catalog import SkuCatalog  # noqa: E402
+
+
+def best_of(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=20000)
+    args = parser.parse_args()
+
+    catalog = SkuCatalog(data_dir=str(ROOT / "data"))
+    catalog.logger.disabled = True
+    catalog.load()
+
+    with open(ROOT / "data" / "sample_orders.json") as f:
+        samples = json.load(f)["orders"]
+    print("Barcode payload (chars): JSON vs binary")
+    for order_id, order in samples.items():
+        text = order_codec.to_barcode_text(order_codec.encode_order(order, catalog.skus))
+        compact = json.dumps(order, separators=(',', ':'))
+        print(f"  {order_id}: {len(compact)} vs {len(text)}")
+
+    rng = random.Random(0)
+    skus = catalog.skus + [f"SKU{i:05d}" for i in range(2000)]
+    orders = [
+        {
+            "order_id": f"ORD{i:07d}",
+            "items": [
+                {"sku": sku, "quantity": rng.randint(1, 50)}
+                for sku in rng.sample(skus, rng.randint(1, 12))
+            ]
+        }
+        for i in range(args.orders)
+    ]
+    # The extra SKUs act as the catalog for the bulk comparison
+    as_json = json.dumps({"orders": {o["order_id"]: o for o in orders}}).encode()
+    as_binary = order_codec.encode_orders(orders, skus)
+
+    json_ms = best_of(lambda: json.loads(as_json))
+    binary_ms = best_of(lambda: order_codec.decode_orders(as_binary, skus))
+    print(f"Bulk file, {args.orders:,} orders:")
+    print(f"  JSON:   {len(as_json):>10,} bytes, load {json_ms:.1f} ms")
+    print(f"  binary: {len(as_binary):>10,} bytes, load {binary_ms:.1f} ms")
+    print(f"  {len(as_json) / len(as_binary):.1f}x smaller, "
+          f"{json_ms / binary_ms:.2f}x load speed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Pick log benchmark: recording cost and projection rebuild time.
+
+Usage:
+    python benchmarks/bench_pick_log.py [--events N]
+
+Times `PickLog.record` with all projections subscribed, then bulk-loads a
+synthetic shift of N events and times a full rebuild of each projection and
+a save/load round trip.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from pick_log import (  # noqa: E402
+    EventType,
+    OrderStateProjection,
+    PickerRateProjection,
+    PickLog,
+    SkuErrorProjection,
+)
+
+PROJECTIONS = (OrderStateProjection, PickerRateProjection, SkuErrorProjection)
+
+
+def synthetic_columns(n, rng):
+    """Columns for n events over 40 stations, 50k orders and 5k SKUs.
+
+    Each order draws its scans from about ten SKUs, as real orders do.
+    """
+    types = rng.choice(
+        [EventType.ORDER_LOADED, EventType.SCAN_VALID, EventType.SCAN_INVALID,
+         EventType.SCAN_DUPLICATE, EventType.ORDER_COMPLETED],
+        size=n, p=[0.02, 0.9, 0.03, 0.03, 0.02]
+    ).astype(np.uint8)
+    stations = rng.integers(1, 41, size=n, dtype=np.uint16)
+    orders = rng.integers(1, 50001, size=n, dtype=np.uint32)
+    skus = (orders * 97 + rng.integers(0, 10, size=n, dtype=np.uint32)) % 5000 + 1
+    arrays = {
+        'ts': np.sort(rng.uniform(0, 8 * 3600, size=n)),
+        'type': types,
+        'station': stations,
+        'picker': stations,
+        'order': orders,
+        'sku': skus,
+        'quantity': (types == EventType.SCAN_VALID).astype(np.int32),
+    }
+    tables = {
+        'station': [""] + [f"ST{i:02d}" for i in range(1, 41)],
+        'order': [""] + [f"ORD{i:06d}" for i in range(1, 50001)],
+        'sku': [""] + [f"SKU{i:05d}" for i in range(1, 5001)],
+    }
+    tables['picker'] = tables['station']
+    return arrays, tables
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label}: {(time.perf_counter() - start) * 1000:.0f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=2_000_000)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    log = PickLog()
+    for cls in PROJECTIONS:
+        log.subscribe(cls())
+    n = 100_000
+    start = time.perf_counter()
+    for i in range(n):
+        log.record(EventType.SCAN_VALID, f"ORD{i % 500}", f"SKU{i % 300}", 1,
+                   station="ST01", ts=float(i))
+    elapsed = time.perf_counter() - start
+    print(f"record with {len(PROJECTIONS)} projections: "
+          f"{elapsed / n * 1e6:.2f} us/event")
+
+    arrays, tables = synthetic_columns(args.events, rng)
+    log = PickLog()
+    log.logger.disabled = True
+    print(f"{args.events:,} events:")
+    timed("bulk load", lambda: log.extend(arrays, tables))
+    for cls in PROJECTIONS:
+        timed(f"rebuild {cls.__name__}", lambda: cls().rebuild(log))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        timed("save segment", lambda: log.save_segment(tmp_dir))
+        timed("load", lambda: PickLog.load(tmp_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Pick server throughput benchmark.
+
+Usage:
+    python benchmarks/bench_pick_server.py [--events N] [--batch N]
+
+Starts a pick server in a background thread, claims one large order and
+queues pick events on a PickClient as fast as possible. The client's
+sender thread delivers them `--batch` events per request; the clock stops
+once the server has acknowledged every event. Reports events per second.
+"""
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from pick_client import PickClient  # noqa: E402
+from pick_server import PickServer  # noqa: E402
+
+
+def start_server():
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    ports = []
+
+    def on_started(server):
+        ports.append(server.sockets[0].getsockname()[1])
+        started.set()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(
+            PickServer().serve("127.0.0.1", 0, started=on_started)
+        )
+
+    threading.Thread(target=run, daemon=True).start()
+    started.wait(timeout=5)
+    return ports[0]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    port = start_server()
+    client = PickClient("BENCH", port=port, batch_size=args.batch)
+    skus = [f"SKU{i:05d}" for i in range(1000)]
+    order = {
+        "order_id": "BENCH001",
+        "items": [{"sku": sku, "quantity": args.events} for sku in skus]
+    }
+    client.claim(order)
+
+    start = time.perf_counter()
+    for i in range(args.events):
+        client.queue_pick("BENCH001", skus[i % len(skus)])
+    # Send whatever the sender thread has not picked up yet
+    client.flush("BENCH001")
+    while client.pending:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    picked = sum(client.status("BENCH001")["picked"].values())
+    assert picked == args.events, f"expected {args.events} picks, got {picked}"
+    print(f"{args.events} events, batch {args.batch}: "
+          f"{elapsed:.2f} s, {args.events / elapsed:,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Startup benchmark: import cost of the app and time to first scan.
+
+Usage:
+    python benchmarks/bench_startup.py
+
+Runs `python -X importtime -c "import main"` to check that the heavy
+camera/vision modules stay out of the startup path, then (when a display is
+available) builds the app and measures time to first paint and time until
+the scanner is ready to take a scan. Exits non-zero if a budget is exceeded.
+"""
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+IMPORT_BUDGET_MS = 150
+FIRST_PAINT_BUDGET_MS = 500
+FIRST_SCAN_BUDGET_MS = 5000  # matches config.CAMERA_TIMEOUT
+
+HEAVY_MODULES = {"cv2", "numpy", "pyzbar", "AVFoundation", "UIKit", "scanner"}
+
+
+def measure_imports():
+    """Return (cumulative import time of main in ms, {module: cumulative ms})."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        modules[name.strip()] = int(cumulative_us) / 1000
+    return modules.get("main", 0.0), modules
+
+
+def measure_first_scan():
+    """Return (ms to first paint, ms until scanner ready) or None without a display."""
+    if sys.platform != "darwin" and not os.environ.get("DISPLAY"):
+        return None
+
+    sys.path.insert(0, str(APP_DIR))
+    start = time.perf_counter()
+    from main import WarehousePickingApp
+
+    app = WarehousePickingApp()
+    app.root.update()
+    first_paint = (time.perf_counter() - start) * 1000
+
+    deadline = time.perf_counter() + FIRST_SCAN_BUDGET_MS / 1000
+    while not app.scanner_ready.is_set() and time.perf_counter() < deadline:
+        app.root.update()
+        time.sleep(0.01)
+    first_scan = (time.perf_counter() - start) * 1000
+    if app.scanner is None:
+        print(f"  scanner unavailable: {app.scanner_error}")
+    app.root.destroy()
+    return first_paint, first_scan
+
+
+def main():
+    failures = []
+
+    main_ms, modules = measure_imports()
+    print(f"import main: {main_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    for name, ms in sorted(modules.items(), key=lambda m: -m[1])[:10]:
+        print(f"  {ms:8.1f} ms  {name}")
+    if main_ms > IMPORT_BUDGET_MS:
+        failures.append("import time over budget")
+    eager = sorted(HEAVY_MODULES.intersection(modules))
+    if eager:
+        failures.append(f"heavy modules imported at startup: {eager}")
+
+    timings = measure_first_scan()
+    if timings is None:
+        print("time to first scan: skipped (no display)")
+    else:
+        first_paint, first_scan = timings
+        print(f"first paint: {first_paint:.1f} ms (budget {FIRST_PAINT_BUDGET_MS} ms)")
+        print(f"time to first scan: {first_scan:.1f} ms (budget {FIRST_SCAN_BUDGET_MS} ms)")
+        if first_paint > FIRST_PAINT_BUDGET_MS:
+            failures.append("first paint over budget")
+        if first_scan > FIRST_SCAN_BUDGET_MS:
+            failures.append("time to first scan over budget")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
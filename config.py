@@ -10,6 +10,7 @@ SKU_DATA_FILE = DATA_DIR / "item_skus.csv"
 # UI Settings
 WINDOW_TITLE = "Warehouse Picking System"
 WINDOW_SIZE = "800x600"
+PREFETCH_ROWS = 3  # upcoming item rows laid out ahead of the next pick
 
 COLORS = {
     "background": "#F5F5F5",
@@ -43,4 +44,15 @@ MESSAGES = {
 
 # Scanner settings
 CAMERA_TIMEOUT = 5  # seconds
-SCAN_DELAY = 0.5    # seconds between scans
\ No newline at end of file
+SCAN_DELAY = 0.5    # seconds between scans
+SCAN_REARM_GAP = 0.25  # seconds a label must be out of view to count again
+
+# Pick log
+PICK_LOG_SAVE_INTERVAL = 30  # seconds between pick log segment saves
+
+# Order replica
+SYNC_INTERVAL = 30  # seconds between feed syncs
+
+# Inventory
+REORDER_POINT = 5  # units left that trigger replenishment, unless set per SKU
+INVENTORY_SNAPSHOT_INTERVAL = 60  # seconds between stock snapshots
\ No newline at end of file
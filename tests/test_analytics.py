@@ -0,0 +1,127 @@
+import unittest
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from analytics import CACHE_FILE, ShiftAnalytics, ShiftData, main
+from pick_log import EventType, PickLog
+
+class TestShiftAnalytics(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp_dir.name)
+        self.write_completion("ORD001", "ST1", "2024-03-20T09:15:00",
+                              {"ABC123": 2, "XYZ789": 1}, {"ABC123": 2, "XYZ789": 1})
+        self.write_completion("ORD002", "ST1", "2024-03-20T10:30:00",
+                              {"ABC123": 4}, {"ABC123": 3})
+        self.write_completion("ORD003", "ST2", "2024-03-20T09:45:00",
+                              {"XYZ789": 5, "BLT234": 2}, {"XYZ789": 5})
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_completion(self, order_id, station, completed_at, required, picked):
+        path = self.data_dir / f"completed_{order_id}_{completed_at}.json"
+        path.write_text(json.dumps({
+            "order_id": order_id,
+            "station": station,
+            "completed_at": completed_at,
+            "required_items": required,
+            "picked_items": picked
+        }))
+
+    def test_load_completion_lines(self):
+        """Test completion files load as one row per order line"""
+        data = ShiftData.from_directory(self.data_dir)
+        self.assertEqual(len(data), 5)
+        self.assertEqual(sorted(data.tables['station']), ["ST1", "ST2"])
+
+    def test_short_picks(self):
+        """Test short-pick rates by line and by unit"""
+        data = ShiftData.from_directory(self.data_dir)
+        short = ShiftAnalytics(data).short_picks()
+
+        self.assertEqual(short['overall']['short_lines'], 2)
+        self.assertEqual(short['overall']['line_rate'], 2 / 5)
+        self.assertEqual(short['overall']['unit_rate'], 3 / 14)
+        self.assertEqual(short['stations']['ST1']['short_lines'], 1)
+        self.assertEqual(short['stations']['ST2']['unit_rate'], 2 / 7)
+
+    def test_legacy_files_skip_short_picks(self):
+        """Test files without required_items are left out of short-pick rates"""
+        path = self.data_dir / "completed_OLD001_2024-03-19T12:00:00.json"
+        path.write_text(json.dumps({
+            "order_id": "OLD001",
+            "completed_at": "2024-03-19T12:00:00",
+            "picked_items": {"ABC123": 1}
+        }))
+        data = ShiftData.from_directory(self.data_dir)
+        short = ShiftAnalytics(data).short_picks()
+
+        self.assertEqual(len(data), 6)
+        self.assertEqual(short['overall']['lines'], 5)
+
+    def test_throughput_per_hour(self):
+        """Test units picked bucketed by station and completion hour"""
+        data = ShiftData.from_directory(self.data_dir)
+        throughput = ShiftAnalytics(data).throughput_per_hour()
+
+        self.assertEqual(throughput['ST1'], {
+            "2024-03-20 09:00": 3,
+            "2024-03-20 10:00": 3
+        })
+        self.assertEqual(throughput['ST2'], {"2024-03-20 09:00": 5})
+
+    def test_sku_velocity(self):
+        """Test SKUs ranked by units picked"""
+        data = ShiftData.from_directory(self.data_dir)
+        velocity = ShiftAnalytics(data).sku_velocity()
+
+        self.assertEqual([v['sku'] for v in velocity], ["XYZ789", "ABC123"])
+        self.assertEqual(velocity[1], {"sku": "ABC123", "units": 5, "orders": 2})
+
+    def test_over_pick_attempts(self):
+        """Test duplicate scans from the pick log count as over-pick attempts"""
+        log = PickLog()
+        log.record(EventType.SCAN_DUPLICATE, "ORD001", "ABC123")
+        log.record(EventType.SCAN_DUPLICATE, "ORD001", "ABC123")
+        log.record(EventType.SCAN_INVALID, "ORD001", "BAD999")
+
+        analytics = ShiftAnalytics(ShiftData.from_directory(self.data_dir), log)
+        self.assertEqual(analytics.over_pick_attempts(), {
+            'total': 2,
+            'skus': [{'sku': "ABC123", 'attempts': 2}]
+        })
+
+    def test_cache_parses_only_new_files(self):
+        """Test the columnar cache is reused and extended with new files"""
+        ShiftData.from_directory(self.data_dir)
+        self.assertTrue((self.data_dir / CACHE_FILE).exists())
+
+        self.write_completion("ORD004", "ST2", "2024-03-20T11:00:00",
+                              {"ABC123": 1}, {"ABC123": 1})
+        data = ShiftData.from_directory(self.data_dir)
+
+        self.assertEqual(len(data), 6)
+        self.assertEqual(len(data.files), 4)
+
+    def test_report_leaves_segments_unless_compacting(self):
+        """Test the CLI only rewrites pick log segments when asked to"""
+        for order_id in ("ORD001", "ORD002"):
+            log = PickLog()
+            log.record(EventType.SCAN_DUPLICATE, order_id, "ABC123")
+            log.save_segment(self.data_dir)
+        segments = sorted(self.data_dir.glob("pick_log_*.npz"))
+
+        with redirect_stdout(io.StringIO()) as out:
+            main(["--data-dir", str(self.data_dir), "--json"])
+        self.assertEqual(json.loads(out.getvalue())['over_pick_attempts']['total'], 2)
+        self.assertEqual(sorted(self.data_dir.glob("pick_log_*.npz")), segments)
+
+        with redirect_stdout(io.StringIO()):
+            main(["--data-dir", str(self.data_dir), "--json", "--compact"])
+        self.assertEqual(list(self.data_dir.glob("pick_log_*.npz")), segments[-1:])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import tempfile
+import threading
+from pathlib import Path
+from catalog import SkuCatalog
+
+class TestSkuCatalog(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        sku_file = Path(self.tmp_dir.name) / "item_skus.csv"
+        sku_file.write_text(
+            "SKU,Name,UnitWeight\n"
+            "ABC123,Widget,250\n"
+            "XYZ789,Gadget,\n"
+        )
+        self.catalog = SkuCatalog(data_dir=self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_load_catalog(self):
+        """Test loading SKU names from CSV"""
+        self.catalog.load()
+
+        self.assertEqual(len(self.catalog), 2)
+        self.assertIn("ABC123", self.catalog)
+        self.assertEqual(self.catalog.get_name("XYZ789"), "Gadget")
+        self.assertTrue(self.catalog.ready.is_set())
+
+    def test_unit_weights(self):
+        """Test unit weights load where the catalog has them"""
+        self.catalog.load()
+        self.assertEqual(self.catalog.get_unit_weight("ABC123"), 250.0)
+        self.assertIsNone(self.catalog.get_unit_weight("XYZ789"))
+
+    def test_lookup_before_load(self):
+        """Test lookups are safe before the catalog has warmed"""
+        self.assertIsNone(self.catalog.get_name("ABC123"))
+        self.assertFalse(self.catalog.ready.is_set())
+
+    def test_load_in_background(self):
+        """Test warming the catalog from a background thread"""
+        thread = threading.Thread(target=self.catalog.load)
+        thread.start()
+
+        self.assertTrue(self.catalog.ready.wait(timeout=5))
+        thread.join()
+        self.assertEqual(self.catalog.get_name("ABC123"), "Widget")
+
+    def test_missing_catalog_file(self):
+        """Test missing catalog loads empty and still signals ready"""
+        catalog = SkuCatalog(data_dir=self.tmp_dir.name, filename="missing.csv")
+        self.assertEqual(catalog.load(), {})
+        self.assertTrue(catalog.ready.is_set())
+
+if __name__ == '__main__':
+    unittest.main()
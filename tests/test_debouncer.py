@@ -0,0 +1,74 @@
+import unittest
+from debouncer import ScanDebouncer
+
+class TestScanDebouncer(unittest.TestCase):
+    def setUp(self):
+        self.debouncer = ScanDebouncer(hold_off=0.5, rearm_gap=0.25)
+
+    def stream(self, value, start, end, interval=0.05):
+        """Feed continuous reads of a label in view; return accepted count"""
+        accepted = 0
+        ts = start
+        while ts < end:
+            accepted += self.debouncer.feed(value, ts=ts)
+            ts += interval
+        return accepted
+
+    def test_first_read_accepted(self):
+        """Test a new label is accepted on its first read"""
+        self.assertTrue(self.debouncer.feed("ABC123", ts=0))
+
+    def test_label_in_view_counts_once(self):
+        """Test continuous reads of one label count a single time"""
+        self.assertEqual(self.stream("ABC123", 0, 3), 1)
+        self.assertEqual(self.debouncer.suppressed, self.debouncer.reads - 1)
+
+    def test_rearm_after_leaving_view(self):
+        """Test a label counts again after it leaves the field of view"""
+        self.stream("ABC123", 0, 1)
+        self.assertTrue(self.debouncer.feed("ABC123", ts=1.5))
+
+    def test_hold_off_blocks_flicker(self):
+        """Test a brief dropout shorter than hold-off does not recount"""
+        self.debouncer.feed("ABC123", ts=0)
+        self.assertFalse(self.debouncer.feed("ABC123", ts=0.3))
+
+    def test_dropout_during_hold_off_does_not_rearm(self):
+        """Test reads after a dropout inside hold-off do not recount"""
+        self.assertTrue(self.debouncer.feed("ABC123", ts=0))
+        # Label stays in view with one 0.3 s dropout, then keeps streaming
+        self.assertEqual(self.stream("ABC123", 0.3, 2), 0)
+
+    def test_values_tracked_independently(self):
+        """Test different labels do not suppress each other"""
+        self.assertTrue(self.debouncer.feed("ABC123", ts=0))
+        self.assertTrue(self.debouncer.feed("XYZ789", ts=0.01))
+        self.assertFalse(self.debouncer.feed("ABC123", ts=0.02))
+
+    def test_explicit_rearm(self):
+        """Test the confirm gesture counts a label that never left view"""
+        self.debouncer.feed("ABC123", ts=0)
+        self.assertFalse(self.debouncer.feed("ABC123", ts=0.05))
+
+        self.assertTrue(self.debouncer.rearm())
+        self.assertTrue(self.debouncer.feed("ABC123", ts=0.1))
+
+    def test_rearm_unknown_value(self):
+        """Test re-arming with nothing scanned does nothing"""
+        self.assertFalse(self.debouncer.rearm())
+
+    def test_capacity_evicts_oldest(self):
+        """Test the tracked table stays bounded"""
+        debouncer = ScanDebouncer(capacity=2)
+        for i, value in enumerate(["A", "B", "C"]):
+            debouncer.feed(value, ts=i * 0.01)
+        self.assertEqual(list(debouncer.values), ["B", "C"])
+
+    def test_reset(self):
+        """Test reset forgets tracked labels"""
+        self.debouncer.feed("ABC123", ts=0)
+        self.debouncer.reset()
+        self.assertTrue(self.debouncer.feed("ABC123", ts=0.05))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import Mock, patch
+from display import FEEDBACK_MIN_DURATION, PickingDisplay
+
+class TestPickingDisplay(unittest.TestCase):
+    def setUp(self):
+        """Build the display against mocked Tk widgets (no screen needed)"""
+        patchers = [patch("display.tk"), patch("display.ttk")]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.root = Mock()
+        self.display = PickingDisplay(self.root)
+        self.order = {
+            "order_id": "TEST001",
+            "items": [
+                {"sku": "ABC123", "quantity": 2},
+                {"sku": "XYZ789", "quantity": 1},
+                {"sku": "WGT123", "quantity": 4}
+            ]
+        }
+
+    def test_rows_follow_pick_sequence(self):
+        """Test rows are drawn in pick-path order when given"""
+        self.display.show_order_items(self.order, sequence=["WGT123", "ABC123", "XYZ789"])
+        self.assertEqual(list(self.display.item_texts), ["WGT123", "ABC123", "XYZ789"])
+
+    def test_rows_default_to_order_sequence(self):
+        """Test rows keep the order file sequence without a pick path"""
+        self.display.show_order_items(self.order, sku_names={"ABC123": "Widget"})
+        self.assertEqual(list(self.display.item_texts), ["ABC123", "XYZ789", "WGT123"])
+        self.assertEqual(self.display.item_texts["ABC123"], "ABC123 (Widget): 2 units")
+
+    def test_feedback_shortened_when_message_queued(self):
+        """Test a queued message cuts the banner on screen short"""
+        self.root.after.side_effect = ["job1", "job2", "job3"]
+        self.display.show_feedback("Invalid SKU", 'error')
+        self.root.after.assert_called_with(3000, self.display._next_feedback)
+
+        self.display.show_feedback("Invalid SKU again", 'error')
+        self.root.after_cancel.assert_called_once_with("job1")
+        delay = self.root.after.call_args[0][0]
+        self.assertLessEqual(delay, FEEDBACK_MIN_DURATION)
+        self.assertGreater(delay, FEEDBACK_MIN_DURATION - 100)
+
+        # A third message does not push the shortened banner back again
+        self.display.show_feedback("Third", 'warning')
+        self.root.after_cancel.assert_called_once()
+        self.assertEqual(self.root.after.call_count, 2)
+
+        # The next banner is also short while a message waits behind it
+        self.display._next_feedback()
+        self.root.after.assert_called_with(
+            FEEDBACK_MIN_DURATION, self.display._next_feedback
+        )
+        self.assertEqual(list(self.display.feedback_queue), [("Third", 'warning')])
+
+    def test_feedback_shortened_by_elapsed_time(self):
+        """Test time already on screen counts towards the shortened duration"""
+        with patch("display.time.monotonic", side_effect=[100.0, 100.5]):
+            self.display.show_feedback("First", 'error')
+            self.display.show_feedback("Second", 'error')
+        self.root.after.assert_called_with(
+            FEEDBACK_MIN_DURATION - 500, self.display._next_feedback
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import unittest
+import tempfile
+from pathlib import Path
+from inventory import InventoryCounter
+
+class TestInventoryCounter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        (Path(self.tmp_dir.name) / "stock.csv").write_text(
+            "SKU,OnHand,ReorderPoint\n"
+            "ABC123,10,3\n"
+            "XYZ789,4,\n"
+        )
+        self.inventory = InventoryCounter(data_dir=self.tmp_dir.name, reorder_point=2)
+        self.inventory.load()
+        self.tasks = []
+        self.inventory.add_replenish_handler(self.tasks.append)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_load_stock(self):
+        """Test seeding counts and reorder points from the stock CSV"""
+        self.assertEqual(self.inventory.get_on_hand("ABC123"), 10)
+        self.assertEqual(self.inventory.reorder_point("ABC123"), 3)
+        self.assertEqual(self.inventory.reorder_point("XYZ789"), 2)
+        self.assertIsNone(self.inventory.get_on_hand("UNKNOWN"))
+        self.assertTrue(self.inventory.ready.is_set())
+
+    def test_record_pick(self):
+        """Test picks decrement counts without opening tasks above threshold"""
+        self.assertIsNone(self.inventory.record_pick("ABC123", 5))
+        self.assertEqual(self.inventory.get_on_hand("ABC123"), 5)
+        self.assertIsNone(self.inventory.record_pick("UNKNOWN"))
+        self.assertEqual(self.tasks, [])
+
+    def test_low_stock_opens_one_task(self):
+        """Test reaching the reorder point opens a single replenishment task"""
+        task = self.inventory.record_pick("ABC123", 7)
+        self.assertEqual(task["sku"], "ABC123")
+        self.assertEqual(task["on_hand"], 3)
+        self.assertIsNone(self.inventory.record_pick("ABC123"))
+        self.assertEqual(self.tasks, [task])
+
+    def test_restock_closes_task(self):
+        """Test restocking above the reorder point closes the task"""
+        self.inventory.record_pick("ABC123", 8)
+        self.inventory.restock("ABC123", 20)
+        self.assertEqual(self.inventory.get_on_hand("ABC123"), 22)
+        self.assertEqual(self.inventory.tasks, {})
+
+    def test_pick_never_goes_negative(self):
+        """Test picking more than the count clamps at zero"""
+        self.inventory.record_pick("XYZ789", 6)
+        self.assertEqual(self.inventory.get_on_hand("XYZ789"), 0)
+
+    def test_short_pick_location_empty(self):
+        """Test an empty location zeroes the count and requests replenishment"""
+        record = self.inventory.record_short_pick("ORD001", "ABC123", 2, "location empty")
+        self.assertEqual(record["reason"], "location empty")
+        self.assertEqual(self.inventory.get_on_hand("ABC123"), 0)
+        self.assertEqual([t["sku"] for t in self.tasks], ["ABC123"])
+
+    def test_short_pick_other_reason(self):
+        """Test other short pick reasons are recorded without changing stock"""
+        self.inventory.record_short_pick("ORD001", "ABC123", 1, "Damaged")
+        self.assertEqual(self.inventory.get_on_hand("ABC123"), 10)
+        self.assertEqual(len(self.inventory.short_picks), 1)
+        self.assertEqual(self.tasks, [])
+
+    def test_shortfalls(self):
+        """Test order lines needing more than is on hand are reported"""
+        shortfalls = self.inventory.shortfalls([
+            {"sku": "ABC123", "quantity": 2},
+            {"sku": "XYZ789", "quantity": 5},
+            {"sku": "UNKNOWN", "quantity": 1}
+        ])
+        self.assertEqual(shortfalls, [{"sku": "XYZ789", "required": 5, "on_hand": 4}])
+
+    def test_snapshot_round_trip(self):
+        """Test a snapshot is written only when dirty and reloads on start"""
+        self.assertIsNone(self.inventory.snapshot())
+        self.inventory.record_pick("ABC123", 8)
+        self.inventory.record_short_pick("ORD001", "XYZ789", 1, "Damaged")
+        self.assertIsNotNone(self.inventory.snapshot())
+        self.assertIsNone(self.inventory.snapshot())
+
+        reloaded = InventoryCounter(data_dir=self.tmp_dir.name)
+        reloaded.load()
+        self.assertEqual(reloaded.get_on_hand("ABC123"), 2)
+        self.assertIn("ABC123", reloaded.tasks)
+        self.assertEqual(reloaded.short_picks, self.inventory.short_picks)
+
+    def test_newer_stock_file_reseeds(self):
+        """Test a stock file newer than the snapshot replaces its counts"""
+        self.inventory.record_pick("ABC123", 8)
+        self.inventory.record_short_pick("ORD001", "XYZ789", 1, "Damaged")
+        snapshot = self.inventory.snapshot()
+
+        stock_file = Path(self.tmp_dir.name) / "stock.csv"
+        stock_file.write_text("SKU,OnHand,ReorderPoint\nABC123,50,3\nXYZ789,1,\n")
+        mtime = snapshot.stat().st_mtime + 10
+        os.utime(stock_file, (mtime, mtime))
+
+        reloaded = InventoryCounter(data_dir=self.tmp_dir.name)
+        reloaded.load()
+        self.assertEqual(reloaded.get_on_hand("ABC123"), 50)
+        self.assertEqual(reloaded.tasks, {})
+        self.assertEqual(len(reloaded.short_picks), 1)
+
+        # Without a newer stock file the snapshot wins
+        reloaded.record_pick("ABC123", 5)
+        reloaded.snapshot()
+        os.utime(stock_file, (mtime - 20, mtime - 20))
+        again = InventoryCounter(data_dir=self.tmp_dir.name)
+        again.load()
+        self.assertEqual(again.get_on_hand("ABC123"), 45)
+
+    def test_updates_before_load_are_applied(self):
+        """Test picks and short picks recorded while loading are not lost"""
+        inventory = InventoryCounter(data_dir=self.tmp_dir.name, reorder_point=2)
+        tasks = []
+        inventory.add_replenish_handler(tasks.append)
+        self.assertIsNone(inventory.record_pick("ABC123", 4))
+        inventory.record_short_pick("ORD001", "XYZ789", 1)
+        self.assertEqual(inventory.short_picks, [])
+
+        inventory.load()
+        self.assertEqual(inventory.get_on_hand("ABC123"), 6)
+        self.assertEqual(inventory.get_on_hand("XYZ789"), 0)
+        self.assertEqual(len(inventory.short_picks), 1)
+        self.assertEqual([t["sku"] for t in tasks], ["XYZ789"])
+
+    def test_missing_stock_file(self):
+        """Test a missing stock file leaves nothing tracked"""
+        inventory = InventoryCounter(data_dir=self.tmp_dir.name, filename="missing.csv")
+        self.assertEqual(inventory.load(), 0)
+        self.assertTrue(inventory.ready.is_set())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+class TestStartup(unittest.TestCase):
+    def test_main_import_is_lightweight(self):
+        """Test importing the app does not load camera/vision modules"""
+        heavy = ["cv2", "numpy", "pyzbar", "AVFoundation", "UIKit", "scanner"]
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys, main; "
+                f"print([m for m in {heavy!r} if m in sys.modules])"
+            ],
+            cwd=APP_DIR,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+class TestBackgroundFeedback(unittest.TestCase):
+    def setUp(self):
+        patchers = [patch("main.tk"), patch("display.tk"), patch("display.ttk")]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        import main
+        self.app = main.WarehousePickingApp()
+        self.app.display.show_feedback = Mock()
+
+    def test_replenishment_shown_from_tk_loop(self):
+        """Test a task opened on another thread is only shown when polled"""
+        task = {'sku': "ABC123", 'reason': "Low stock"}
+        thread = threading.Thread(target=self.app.on_replenish, args=(task,))
+        thread.start()
+        thread.join()
+        self.app.display.show_feedback.assert_not_called()
+
+        self.app.poll_replenishments()
+        self.app.display.show_feedback.assert_called_once_with(
+            "Replenishment requested for ABC123 (Low stock)", 'warning'
+        )
+        self.app.root.after.assert_called_with(250, self.app.poll_replenishments)
+
+    def test_replica_conflict_shown(self):
+        """Test a completion rejected during sync is shown on the Tk loop"""
+        self.app.replica = Mock()
+        self.app.replica.take_conflicts.return_value = [
+            {'order_id': "ORD001", 'reason': "Order cancelled"}
+        ]
+        self.app.poll_replica()
+        self.app.display.show_feedback.assert_called_once_with(
+            "Completion of ORD001 rejected: Order cancelled", 'error'
+        )
+        self.app.root.after.assert_called_with(1000, self.app.poll_replica)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import threading
 from matcher import ItemMatcher
 
 class TestItemMatcher(unittest.TestCase):
@@ -96,5 +97,97 @@ class TestItemMatcher(unittest.TestCase):
         with self.assertRaises(ValueError):
             matcher.check_item("ABC123", self.sample_order)
 
+    def test_pick_quantity(self):
+        """Test picking several units in one step"""
+        result = self.matcher.pick_quantity("ABC123", 2, self.sample_order)
+        self.assertTrue(result["valid"])
+        self.assertEqual(self.matcher.current_items["ABC123"].quantity_picked, 2)
+
+    def test_pick_quantity_over_remaining(self):
+        """Test a quantity above the remaining count is rejected whole"""
+        self.matcher.check_item("ABC123", self.sample_order)
+        result = self.matcher.pick_quantity("ABC123", 2, self.sample_order)
+
+        self.assertFalse(result["valid"])
+        self.assertEqual(result["message"], "Only 1 of ABC123 remaining, not 2")
+        self.assertEqual(self.matcher.current_items["ABC123"].quantity_picked, 1)
+
+    def test_pick_quantity_completes_order(self):
+        """Test bulk picks complete the order"""
+        self.matcher.pick_quantity("ABC123", 2, self.sample_order)
+        result = self.matcher.pick_quantity("XYZ789", 1, self.sample_order)
+        self.assertTrue(result["order_complete"])
+
+    def test_pick_invalid_quantity(self):
+        """Test non-positive quantities raise"""
+        with self.assertRaises(ValueError):
+            self.matcher.pick_quantity("ABC123", 0, self.sample_order)
+
+    def test_concurrent_bulk_picks(self):
+        """Test concurrent picks never exceed the required quantity"""
+        self.matcher.load_order_items([{"sku": "BLT234", "quantity": 100}])
+        accepted = []
+
+        def pick():
+            for _ in range(50):
+                if self.matcher.pick_quantity("BLT234", 3, self.sample_order)["valid"]:
+                    accepted.append(3)
+
+        threads = [threading.Thread(target=pick) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        picked = self.matcher.current_items["BLT234"].quantity_picked
+        self.assertEqual(picked, sum(accepted))
+        self.assertEqual(picked, 99)
+
+    def test_load_with_picked_counts(self):
+        """Test resuming an order with units already picked"""
+        self.matcher.load_order_items(self.sample_order["items"], {"ABC123": 2})
+        remaining = self.matcher.get_remaining_items()
+        self.assertEqual(remaining, [{"sku": "XYZ789", "remaining": 1}])
+
+    def test_next_item_follows_pick_path(self):
+        """Test next item walks locations aisle, bay, then shelf"""
+        self.matcher.load_order_items([
+            {"sku": "C", "quantity": 1, "location": "B-02-1"},
+            {"sku": "A", "quantity": 1, "location": "A-10-1"},
+            {"sku": "D", "quantity": 1},
+            {"sku": "B", "quantity": 1, "location": "A-9-3"},
+        ])
+        self.assertEqual(self.matcher.pick_sequence, ["B", "A", "C", "D"])
+        self.assertEqual(self.matcher.next_item(), "B")
+        self.assertEqual(self.matcher.upcoming_items(2), ["A", "C"])
+
+    def test_next_item_without_locations(self):
+        """Test order lines are kept when no locations are given"""
+        self.assertEqual(self.matcher.next_item(), "ABC123")
+        self.matcher.pick_quantity("ABC123", 2, self.sample_order)
+        self.assertEqual(self.matcher.next_item(), "XYZ789")
+        self.matcher.check_item("XYZ789", self.sample_order)
+        self.assertIsNone(self.matcher.next_item())
+        self.assertEqual(self.matcher.upcoming_items(3), [])
+
+    def test_next_item_out_of_order_picks(self):
+        """Test lines picked ahead of the cursor are skipped"""
+        self.matcher.load_order_items([
+            {"sku": "A", "quantity": 1, "location": "A-01"},
+            {"sku": "B", "quantity": 1, "location": "A-02"},
+            {"sku": "C", "quantity": 1, "location": "A-03"},
+        ])
+        self.matcher.check_item("B", self.sample_order)
+        self.assertEqual(self.matcher.next_item(), "A")
+        self.assertEqual(self.matcher.upcoming_items(3), ["C"])
+        self.matcher.check_item("A", self.sample_order)
+        self.assertEqual(self.matcher.next_item(), "C")
+
+    def test_reset_clears_pick_sequence(self):
+        """Test reset forgets the pick path"""
+        self.matcher.reset()
+        self.assertEqual(self.matcher.pick_sequence, [])
+        self.assertIsNone(self.matcher.next_item())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
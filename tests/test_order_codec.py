@@ -0,0 +1,81 @@
+import unittest
+import order_codec
+
+SKUS = ["WGT123", "GDG456", "TLS789", "BLT234"]
+
+class TestOrderCodec(unittest.TestCase):
+    def setUp(self):
+        self.order = {
+            "order_id": "ORD001",
+            "customer": "Warehouse A",
+            "items": [
+                {"sku": "WGT123", "quantity": 5},
+                {"sku": "BLT234", "quantity": 300}
+            ]
+        }
+
+    def test_varint_roundtrip(self):
+        """Test varints across byte boundaries"""
+        for value in (0, 1, 127, 128, 300, 2 ** 32):
+            out = bytearray()
+            order_codec.write_varint(out, value)
+            self.assertEqual(order_codec.read_varint(bytes(out), 0), (value, len(out)))
+
+    def test_single_order_roundtrip(self):
+        """Test encoding and decoding one order"""
+        data = order_codec.encode_order(self.order, SKUS)
+        self.assertEqual(order_codec.decode_order(data, SKUS), self.order)
+
+    def test_compression_choice(self):
+        """Test compression can be forced either way"""
+        for compress in (True, False):
+            data = order_codec.encode_order(self.order, SKUS, compress=compress)
+            self.assertEqual(bool(data[3] & order_codec.FLAG_ZLIB), compress)
+            self.assertEqual(order_codec.decode_order(data, SKUS), self.order)
+
+    def test_names_from_catalog(self):
+        """Test item names are filled in from the catalog on decode"""
+        data = order_codec.encode_order(self.order, SKUS)
+        order = order_codec.decode_order(data, SKUS, {"WGT123": "Heavy Duty Widget"})
+        self.assertEqual(order["items"][0]["name"], "Heavy Duty Widget")
+        self.assertNotIn("name", order["items"][1])
+
+    def test_unknown_sku(self):
+        """Test SKUs missing from the catalog are stored inline"""
+        self.order["items"].append({"sku": "NEW999", "quantity": 1})
+        data = order_codec.encode_order(self.order, SKUS)
+        self.assertEqual(order_codec.decode_order(data, SKUS)["items"][2]["sku"], "NEW999")
+
+    def test_grown_catalog_still_decodes(self):
+        """Test payloads decode after SKUs are appended to the catalog"""
+        data = order_codec.encode_order(self.order, SKUS)
+        self.assertEqual(order_codec.decode_order(data, SKUS + ["NUT567"]), self.order)
+
+    def test_catalog_mismatch(self):
+        """Test decoding against a reordered catalog fails loudly"""
+        data = order_codec.encode_order(self.order, SKUS)
+        with self.assertRaises(ValueError):
+            order_codec.decode_order(data, list(reversed(SKUS)))
+
+    def test_bulk_roundtrip(self):
+        """Test encoding many orders column-wise"""
+        orders = [self.order, {"order_id": "ORD002", "items": [{"sku": "X1", "quantity": 2}]}]
+        data = order_codec.encode_orders(orders, SKUS)
+        self.assertEqual(order_codec.decode_orders(data, SKUS), orders)
+
+    def test_decode_orders_accepts_single(self):
+        """Test bulk decoding also reads a single-order payload"""
+        data = order_codec.encode_order(self.order, SKUS)
+        self.assertEqual(order_codec.decode_orders(data, SKUS), [self.order])
+
+    def test_barcode_text(self):
+        """Test barcode text is QR-alphanumeric and roundtrips"""
+        data = order_codec.encode_order(self.order, SKUS)
+        text = order_codec.to_barcode_text(data)
+
+        self.assertTrue(order_codec.is_barcode_text(text))
+        self.assertTrue(set(text) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 $%*+-./:"))
+        self.assertEqual(order_codec.from_barcode_text(text), data)
+
+if __name__ == '__main__':
+    unittest.main()
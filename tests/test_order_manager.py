@@ -1,8 +1,10 @@
 import unittest
-from unittest.mock import mock_open, patch
+from unittest.mock import Mock, mock_open, patch
 import json
+import tempfile
 from pathlib import Path
 from order_manager import OrderManager
+import order_codec
 
 class TestOrderManager(unittest.TestCase):
     def setUp(self):
@@ -121,5 +123,85 @@ class TestOrderManager(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.manager.complete_order("TEST001")
 
+    def test_pick_client_integration(self):
+        """Test orders are claimed and picks reported through a pick client"""
+        client = Mock()
+        client.claim.return_value = {"picked": {"ABC123": 1}}
+        manager = OrderManager(data_dir="test_data", pick_client=client)
+        
+        manager.load_order(json.dumps(self.sample_order))
+        result = manager.update_order("ABC123")
+        
+        # Resumes from the server's pick counts
+        self.assertEqual(result["picked"], 2)
+        client.queue_pick.assert_called_once_with(
+            order_id="TEST001", sku="ABC123", quantity=1
+        )
+        
+        with patch("builtins.open", mock_open()):
+            manager.complete_order("TEST001")
+        client.complete.assert_called_once_with("TEST001")
+
+    def test_load_order_from_replica(self):
+        """Test order codes are looked up in the local replica first"""
+        replica = Mock()
+        replica.checkout.return_value = (dict(self.sample_order), 3)
+        manager = OrderManager(data_dir="test_data", replica=replica)
+        
+        loaded_order = manager.load_order("TEST001")
+        self.assertEqual(loaded_order["order_id"], "TEST001")
+        
+        with patch("builtins.open", mock_open()):
+            manager.complete_order("TEST001")
+        completion, version = replica.queue_completion.call_args[0]
+        self.assertEqual(completion["order_id"], "TEST001")
+        self.assertEqual(version, 3)
+        
+    def test_order_outside_replica_not_queued(self):
+        """Test orders loaded from barcode data skip the replica outbox"""
+        replica = Mock()
+        manager = OrderManager(data_dir="test_data", replica=replica)
+        manager.load_order(json.dumps(self.sample_order))
+        
+        with patch("builtins.open", mock_open()):
+            manager.complete_order("TEST001")
+        replica.queue_completion.assert_not_called()
+
+    def test_load_order_from_binary_barcode(self):
+        """Test binary barcode payloads are detected and decoded"""
+        catalog = Mock()
+        catalog.skus = ["ABC123", "XYZ789"]
+        catalog.names = {"ABC123": "Widget"}
+        manager = OrderManager(data_dir="test_data", catalog=catalog)
+        barcode = order_codec.to_barcode_text(
+            order_codec.encode_order(self.sample_order, catalog.skus)
+        )
+        
+        loaded_order = manager.load_order(barcode)
+        self.assertEqual(loaded_order["order_id"], "TEST001")
+        self.assertEqual(loaded_order["items"][0]["name"], "Widget")
+        self.assertEqual(loaded_order["items"][1]["quantity"], 1)
+        
+    def test_load_order_from_binary_file(self):
+        """Test a binary order file must contain the requested order"""
+        catalog = Mock()
+        catalog.skus = ["ABC123", "XYZ789"]
+        catalog.names = {}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manager = OrderManager(data_dir=tmp_dir, catalog=catalog)
+            other = dict(self.sample_order, order_id="TEST002")
+            for name, orders in (("TEST001", [other, self.sample_order]),
+                                 ("TEST003", [other]),
+                                 ("TEST004", [])):
+                (Path(tmp_dir) / f"{name}.apo").write_bytes(
+                    order_codec.encode_orders(orders, catalog.skus)
+                )
+                
+            self.assertEqual(manager.load_order("TEST001")["order_id"], "TEST001")
+            with self.assertRaises(FileNotFoundError):
+                manager.load_order("TEST003")
+            with self.assertRaises(FileNotFoundError):
+                manager.load_order("TEST004")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,143 @@
+import unittest
+import tempfile
+from pathlib import Path
+from pick_log import (
+    EventType,
+    OrderStateProjection,
+    PickerRateProjection,
+    PickLog,
+    SkuErrorProjection,
+)
+
+class TestPickLog(unittest.TestCase):
+    def setUp(self):
+        self.log = PickLog()
+        self.record_shift(self.log)
+
+    def record_shift(self, log):
+        """Two orders picked by two stations over one hour"""
+        log.record(EventType.ORDER_LOADED, "ORD001", station="ST1", ts=0)
+        log.record(EventType.SCAN_VALID, "ORD001", "ABC123", 1, station="ST1", ts=60)
+        log.record(EventType.SCAN_INVALID, "ORD001", "BAD999", station="ST1", ts=120)
+        log.record(EventType.SCAN_VALID, "ORD001", "ABC123", 1, station="ST1", ts=180)
+        log.record(EventType.SCAN_DUPLICATE, "ORD001", "ABC123", station="ST1", ts=240)
+        log.record(EventType.ORDER_COMPLETED, "ORD001", station="ST1", ts=300)
+        log.record(EventType.ORDER_LOADED, "ORD002", station="ST2", ts=0)
+        log.record(EventType.SCAN_VALID, "ORD002", "XYZ789", 10, station="ST2", ts=3600)
+
+    def test_record_events(self):
+        """Test events are stored with dictionary-coded strings"""
+        self.assertEqual(len(self.log), 8)
+        self.assertEqual(self.log.tables['order'], ["", "ORD001", "ORD002"])
+        self.assertEqual(self.log.columns['type'][2], EventType.SCAN_INVALID)
+
+    def test_order_state(self):
+        """Test current order state and dwell time"""
+        report = self.log.subscribe(OrderStateProjection()).report(self.log)
+
+        self.assertEqual(report["ORD001"]["picked"], {"ABC123": 2})
+        self.assertTrue(report["ORD001"]["complete"])
+        self.assertEqual(report["ORD001"]["dwell_seconds"], 300)
+        self.assertFalse(report["ORD002"]["complete"])
+        self.assertIsNone(report["ORD002"]["dwell_seconds"])
+
+    def test_picker_rates(self):
+        """Test picks per hour and error rate per picker"""
+        report = self.log.subscribe(PickerRateProjection()).report(self.log)
+
+        self.assertEqual(report["ST1"]["units_picked"], 2)
+        self.assertEqual(report["ST1"]["scans"], 4)
+        self.assertEqual(report["ST1"]["error_rate"], 0.5)
+        self.assertEqual(report["ST1"]["picks_per_hour"], 2 / (180 / 3600))
+        # A single scan has no time span to rate against
+        self.assertIsNone(report["ST2"]["picks_per_hour"])
+
+    def test_sku_hot_spots(self):
+        """Test SKU error counts ranked worst first"""
+        projection = self.log.subscribe(SkuErrorProjection())
+        self.log.record(EventType.SCAN_INVALID, "ORD002", "BAD999", station="ST2")
+        self.assertEqual(
+            projection.hot_spots(self.log),
+            [
+                {"sku": "BAD999", "invalid": 2, "duplicate": 0},
+                {"sku": "ABC123", "invalid": 0, "duplicate": 1},
+            ]
+        )
+
+    def test_incremental_matches_rebuild(self):
+        """Test projections fed event by event equal a full rebuild"""
+        log = PickLog()
+        projections = [
+            log.subscribe(OrderStateProjection()),
+            log.subscribe(PickerRateProjection()),
+            log.subscribe(SkuErrorProjection()),
+        ]
+        self.record_shift(log)
+
+        for projection in projections:
+            rebuilt = type(projection)()
+            rebuilt.rebuild(log)
+            self.assertEqual(vars(rebuilt), vars(projection))
+
+    def test_save_and_load_segments(self):
+        """Test segments from separate logs merge with remapped ids"""
+        other = PickLog()
+        other.record(EventType.ORDER_LOADED, "ORD003", station="ST3", ts=10)
+        other.record(EventType.SCAN_VALID, "ORD003", "ABC123", 4, station="ST3", ts=20)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.log.save_segment(tmp_dir)
+            other.save_segment(tmp_dir)
+            # Nothing new to save
+            self.assertIsNone(other.save_segment(tmp_dir))
+
+            loaded = PickLog.load(tmp_dir)
+
+        self.assertEqual(len(loaded), 10)
+        report = loaded.subscribe(OrderStateProjection()).report(loaded)
+        self.assertEqual(report["ORD001"]["picked"], {"ABC123": 2})
+        self.assertEqual(report["ORD003"]["picked"], {"ABC123": 4})
+
+    def test_segment_tables_hold_only_used_strings(self):
+        """Test a segment stores only the strings its own events use"""
+        import numpy as np
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.log.save_segment(tmp_dir)
+            self.log.record(EventType.SCAN_VALID, "ORD009", "XYZ789", 1, station="ST1")
+            path = self.log.save_segment(tmp_dir)
+            with np.load(path) as segment:
+                self.assertEqual(segment["table_order"].tolist(), ["ORD009"])
+                self.assertEqual(segment["table_sku"].tolist(), ["XYZ789"])
+                self.assertEqual(segment["order"].tolist(), [0])
+
+            loaded = PickLog.load(tmp_dir)
+        report = loaded.subscribe(OrderStateProjection()).report(loaded)
+        self.assertEqual(report["ORD009"]["picked"], {"XYZ789": 1})
+        self.assertEqual(report["ORD001"]["picked"], {"ABC123": 2})
+
+    def test_save_segment_leaves_no_partial_file(self):
+        """Test a saved segment is renamed into place with no temp file left"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self.log.save_segment(tmp_dir)
+            self.assertEqual(list(Path(tmp_dir).iterdir()), [path])
+
+    def test_load_compacts_segments(self):
+        """Test compacting merges segments into one with the same events"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.log.save_segment(tmp_dir)
+            self.log.record(EventType.SCAN_VALID, "ORD004", "ABC123", 3, station="ST2")
+            self.log.save_segment(tmp_dir)
+
+            compacted = PickLog.load(tmp_dir, compact=True)
+            self.assertEqual(len(list(Path(tmp_dir).glob("pick_log_*.npz"))), 1)
+            reloaded = PickLog.load(tmp_dir)
+
+        self.assertEqual(len(reloaded), len(self.log))
+        self.assertEqual(
+            reloaded.subscribe(OrderStateProjection()).report(reloaded),
+            compacted.subscribe(OrderStateProjection()).report(compacted)
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,307 @@
+import unittest
+import asyncio
+import threading
+import time
+from pick_server import PickServer
+from pick_client import PickClient
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestPickServer(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.server = PickServer(lease_seconds=30, clock=self.clock)
+        self.order = {
+            "order_id": "TEST001",
+            "items": [
+                {"sku": "ABC123", "quantity": 2},
+                {"sku": "XYZ789", "quantity": 1}
+            ]
+        }
+
+    def claim(self, station="ST1"):
+        return self.server.handle({
+            "op": "claim", "order_id": "TEST001",
+            "station": station, "order": self.order
+        })
+
+    def pick(self, event_id, sku, station="ST1", quantity=1):
+        return self.server.handle({
+            "op": "pick", "order_id": "TEST001", "station": station,
+            "events": [{"event_id": event_id, "sku": sku, "quantity": quantity}]
+        })
+
+    def test_claim_order(self):
+        """Test claiming a new order registers it"""
+        response = self.claim()
+        self.assertTrue(response["ok"])
+        self.assertEqual(response["picked"], {})
+
+    def test_claim_conflict(self):
+        """Test a second station cannot claim a leased order"""
+        self.claim("ST1")
+        response = self.claim("ST2")
+        self.assertFalse(response["ok"])
+        self.assertIn("claimed by ST1", response["error"])
+
+    def test_claim_after_lease_expires(self):
+        """Test an expired lease can be taken over with picks preserved"""
+        self.claim("ST1")
+        self.pick("e1", "ABC123")
+        self.clock.now += 31
+
+        response = self.claim("ST2")
+        self.assertTrue(response["ok"])
+        self.assertEqual(response["picked"], {"ABC123": 1})
+
+    def test_pick_renews_lease(self):
+        """Test activity from the claim holder keeps the lease alive"""
+        self.claim("ST1")
+        self.clock.now += 20
+        self.pick("e1", "ABC123")
+        self.clock.now += 20
+        self.assertFalse(self.claim("ST2")["ok"])
+
+    def test_pick_without_claim(self):
+        """Test picks from a station without the claim are rejected"""
+        self.claim("ST1")
+        response = self.pick("e1", "ABC123", station="ST2")
+        self.assertFalse(response["ok"])
+
+    def test_duplicate_event_is_idempotent(self):
+        """Test resending an event does not double count"""
+        self.claim()
+        first = self.pick("e1", "ABC123")
+        retry = self.pick("e1", "ABC123")
+
+        self.assertEqual(first["results"], retry["results"])
+        status = self.server.handle({"op": "status", "order_id": "TEST001"})
+        self.assertEqual(status["picked"], {"ABC123": 1})
+
+    def test_over_pick_rejected(self):
+        """Test picks beyond required quantity are rejected"""
+        self.claim()
+        result = self.pick("e1", "ABC123", quantity=3)["results"][0]
+        self.assertFalse(result["valid"])
+        self.assertIn("already picked", result["message"])
+
+    def test_invalid_sku_rejected(self):
+        """Test picks for SKUs not in the order are rejected"""
+        self.claim()
+        result = self.pick("e1", "INVALID")["results"][0]
+        self.assertFalse(result["valid"])
+
+    def test_complete_releases_claim(self):
+        """Test completing an order releases it and blocks reclaiming"""
+        self.claim()
+        response = self.server.handle(
+            {"op": "complete", "order_id": "TEST001", "station": "ST1"}
+        )
+        self.assertTrue(response["ok"])
+        self.assertIn("already completed", self.claim("ST2")["error"])
+
+    def test_complete_resend_succeeds(self):
+        """Test completing again from the same station is answered, not rejected"""
+        self.claim("ST1")
+        self.pick("e1", "ABC123")
+        request = {"op": "complete", "order_id": "TEST001", "station": "ST1"}
+        first = self.server.handle(dict(request))
+        retry = self.server.handle(dict(request))
+        self.assertTrue(retry["ok"])
+        self.assertEqual(retry["picked"], first["picked"])
+
+        other = self.server.handle(dict(request, station="ST2"))
+        self.assertFalse(other["ok"])
+
+    def test_unknown_op(self):
+        """Test unknown ops return an error"""
+        self.assertFalse(self.server.handle({"op": "bogus"})["ok"])
+
+class TestPickClient(unittest.TestCase):
+    def setUp(self):
+        self.servers = []
+        self.port = self.start_server()
+        self.client = PickClient("ST1", port=self.port, batch_size=3, flush_interval=60)
+        self.order = {
+            "order_id": "TEST001",
+            "items": [{"sku": "ABC123", "quantity": 5}]
+        }
+
+    def start_server(self, lease_seconds=30.0):
+        """Run a pick server on an ephemeral port in a background loop"""
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+        ports = []
+
+        def on_started(server):
+            ports.append(server.sockets[0].getsockname()[1])
+            started.set()
+
+        task = loop.create_task(
+            PickServer(lease_seconds=lease_seconds).serve("127.0.0.1", 0, started=on_started)
+        )
+
+        def run():
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(task)
+            except asyncio.CancelledError:
+                pass
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        started.wait(timeout=5)
+        self.servers.append((loop, task, thread))
+        return ports[0]
+
+    def tearDown(self):
+        self.client.close()
+        for loop, task, thread in self.servers:
+            loop.call_soon_threadsafe(task.cancel)
+            thread.join(timeout=5)
+            loop.close()
+
+    def wait_for(self, predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() > deadline:
+                self.fail("Timed out waiting for the sender thread")
+            time.sleep(0.01)
+
+    def test_batched_picks(self):
+        """Test picks are sent in the background once a batch fills"""
+        self.client.claim(self.order)
+        self.client.queue_pick("TEST001", "ABC123")
+        self.client.queue_pick("TEST001", "ABC123")
+        self.assertEqual(self.client.status("TEST001")["picked"], {})
+
+        self.client.queue_pick("TEST001", "ABC123")
+        self.wait_for(lambda: self.client.status("TEST001")["picked"] == {"ABC123": 3})
+
+    def test_partial_batch_sent_on_timer(self):
+        """Test a partial batch is sent after the flush interval"""
+        self.client.flush_interval = 0.05
+        self.client.claim(self.order)
+        self.client.queue_pick("TEST001", "ABC123")
+        self.wait_for(lambda: self.client.status("TEST001")["picked"] == {"ABC123": 1})
+        self.assertEqual(self.client.pending, {})
+
+    def test_idle_holder_keeps_claim(self):
+        """Test a holder idle for longer than the lease still completes"""
+        port = self.start_server(lease_seconds=0.3)
+        client = PickClient("ST1", port=port, flush_interval=60)
+        other = PickClient("ST2", port=port)
+        try:
+            client.claim(self.order)
+            client.queue_pick("TEST001", "ABC123")
+            time.sleep(1.0)
+
+            with self.assertRaises(RuntimeError):
+                other.claim(self.order)
+            response = client.complete("TEST001")
+            self.assertEqual(response["picked"], {"ABC123": 1})
+        finally:
+            client.close()
+            other.close()
+
+    def test_lost_claim_reported(self):
+        """Test picks for an order taken over elsewhere are dropped and reported"""
+        port = self.start_server(lease_seconds=0.2)
+        client = PickClient("ST1", port=port, flush_interval=60)
+        other = PickClient("ST2", port=port)
+        try:
+            client.claim(self.order)
+            client.close()  # stops the heartbeat
+            time.sleep(0.3)
+            other.claim(self.order)
+
+            client.queue_pick("TEST001", "ABC123")
+            client.send_pending()
+            self.assertEqual(client.pending, {})
+            self.assertIn("Lost claim on TEST001", client.take_errors()[0])
+            self.assertEqual(client.take_errors(), [])
+        finally:
+            client.close()
+            other.close()
+
+    def test_unreachable_server_keeps_picks(self):
+        """Test picks stay queued while the server is unreachable"""
+        self.client.claim(self.order)
+        self.client.queue_pick("TEST001", "ABC123")
+        self.client.port = 1
+        self.client.retries = 0
+        self.client._disconnect()
+
+        self.client.send_pending()
+        self.assertEqual(len(self.client.pending["TEST001"]), 1)
+        self.assertIn("unreachable", self.client.take_errors()[0])
+
+        self.client.port = self.port
+        self.client.send_pending()
+        self.assertEqual(self.client.pending, {})
+        self.assertEqual(self.client.status("TEST001")["picked"], {"ABC123": 1})
+
+    def test_retry_after_lost_connection(self):
+        """Test a batch resent after reconnecting is applied once"""
+        self.client.claim(self.order)
+        self.client.queue_pick("TEST001", "ABC123")
+        batch = list(self.client.pending["TEST001"])
+        self.client.flush("TEST001")
+
+        # Simulate a lost response: the same batch is sent again
+        self.client._disconnect()
+        self.client.pending["TEST001"] = batch
+        results = self.client.flush("TEST001")
+
+        self.assertTrue(results[0]["valid"])
+        self.assertEqual(self.client.status("TEST001")["picked"], {"ABC123": 1})
+
+    def test_large_backlog_sent_in_chunks(self):
+        """Test a backlog larger than one request line is delivered"""
+        order = {"order_id": "TEST002", "items": [{"sku": "ABC123", "quantity": 2000}]}
+        self.client.batch_size = 100
+        self.client.claim(order)
+        with self.client._lock:
+            self.client.pending["TEST002"] = [
+                {"event_id": f"e{i}", "sku": "ABC123", "quantity": 1}
+                for i in range(2000)
+            ]
+
+        results = self.client.flush("TEST002")
+        self.assertEqual(len(results), 2000)
+        self.assertEqual(self.client.pending, {})
+        self.assertEqual(self.client.status("TEST002")["picked"], {"ABC123": 2000})
+
+    def test_large_claim_accepted(self):
+        """Test a claim larger than asyncio's default line limit is read"""
+        order = {
+            "order_id": "TEST003",
+            "items": [{"sku": f"SKU{i:05d}", "quantity": 1} for i in range(5000)]
+        }
+        response = self.client.claim(order)
+        self.assertEqual(response["picked"], {})
+
+    def test_claim_conflict_raises(self):
+        """Test claiming an order held by another station raises"""
+        self.client.claim(self.order)
+        other = PickClient("ST2", port=self.port)
+        try:
+            with self.assertRaises(RuntimeError):
+                other.claim(self.order)
+        finally:
+            other.close()
+
+    def test_complete_flushes_pending(self):
+        """Test completion sends outstanding picks first"""
+        self.client.claim(self.order)
+        self.client.queue_pick("TEST001", "ABC123")
+        response = self.client.complete("TEST001")
+        self.assertEqual(response["picked"], {"ABC123": 1})
+
+if __name__ == '__main__':
+    unittest.main()
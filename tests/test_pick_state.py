@@ -0,0 +1,297 @@
+import json
+import tempfile
+import threading
+import unittest
+
+from hypothesis import settings, strategies as st
+from hypothesis.stateful import (
+    RuleBasedStateMachine, initialize, invariant, precondition, rule
+)
+
+from matcher import ItemMatcher
+from order_manager import OrderManager
+from pick_log import EventType, OrderStateProjection, PickLog, SkuErrorProjection
+
+SKUS = ["ABC123", "XYZ789", "WGT123", "GDG456", "TLS789"]
+
+
+class Station:
+    """Matcher, order manager and journal wired up as the app does per scan."""
+
+    def __init__(self, data_dir: str):
+        self.matcher = ItemMatcher()
+        self.manager = OrderManager(data_dir=data_dir)
+        self.log = PickLog()
+        self.orders = self.log.subscribe(OrderStateProjection())
+        self.errors = self.log.subscribe(SkuErrorProjection())
+        for component in (self.matcher, self.manager, self.log):
+            component.logger.disabled = True
+        self.order = None
+
+    def load(self, order):
+        self.order = self.manager.load_order(json.dumps(order))
+        self.matcher.load_order_items(self.order['items'])
+        self.log.record(EventType.ORDER_LOADED, self.order['order_id'])
+
+    def scan(self, sku: str, quantity: int = 1):
+        order_id = self.order['order_id']
+        result = self.matcher.pick_quantity(sku, quantity, self.order)
+        if result["valid"]:
+            self.manager.update_order(sku, quantity)
+            self.log.record(EventType.SCAN_VALID, order_id, sku, quantity)
+        elif sku in self.matcher.current_items:
+            self.log.record(EventType.SCAN_DUPLICATE, order_id, sku, quantity)
+        else:
+            self.log.record(EventType.SCAN_INVALID, order_id, sku)
+        return result
+
+    def complete(self):
+        order_id = self.order['order_id']
+        self.manager.complete_order(order_id)
+        self.log.record(EventType.ORDER_COMPLETED, order_id)
+        self.matcher.reset()
+
+    def completion_files(self):
+        return sorted(self.manager.data_dir.glob("completed_*.json"))
+
+
+class PickStateMachine(RuleBasedStateMachine):
+    """
+    Random interleavings of order loads, scans and completions.
+
+    A plain dict model tracks what should have been picked; the invariants
+    compare it with the matcher, the order manager and the journal.
+    """
+
+    @initialize()
+    def setup(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.station = Station(self.tmp_dir.name)
+        self.required = {}
+        self.picked = {}
+        self.completed = []
+        self.complete_signals = 0
+        self.next_id = 0
+        # sku -> [invalid, duplicate] scans across all orders
+        self.scan_errors = {}
+
+    def teardown(self):
+        if hasattr(self, "tmp_dir"):
+            self.tmp_dir.cleanup()
+
+    @precondition(lambda self: not self.required)
+    @rule(lines=st.dictionaries(
+        st.sampled_from(SKUS), st.integers(1, 5), min_size=1, max_size=len(SKUS)
+    ))
+    def load_order(self, lines):
+        self.next_id += 1
+        self.station.load({
+            "order_id": f"ORD{self.next_id:03d}",
+            "items": [{"sku": sku, "quantity": n} for sku, n in lines.items()]
+        })
+        self.required = dict(lines)
+        self.picked = {}
+        self.complete_signals = 0
+
+    @precondition(lambda self: self.required)
+    @rule(sku=st.sampled_from(SKUS + ["UNKNOWN"]), quantity=st.integers(1, 6))
+    def scan(self, sku, quantity):
+        remaining = self.required.get(sku, 0) - self.picked.get(sku, 0)
+        result = self.station.scan(sku, quantity)
+
+        assert result["valid"] == (0 < quantity <= remaining)
+        if result["valid"]:
+            self.picked[sku] = self.picked.get(sku, 0) + quantity
+        else:
+            self.scan_errors.setdefault(sku, [0, 0])[sku in self.required] += 1
+        if result["order_complete"]:
+            self.complete_signals += 1
+
+    @precondition(lambda self: self.required)
+    @rule(finish_anyway=st.booleans())
+    def complete(self, finish_anyway):
+        if not finish_anyway and self.picked != self.required:
+            return
+        order_id = self.station.order['order_id']
+        self.station.complete()
+        self.completed.append(order_id)
+        self.required = {}
+        self.complete_signals = 0
+
+        try:
+            self.station.manager.complete_order(order_id)
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError(f"{order_id} completed twice")
+
+    @invariant()
+    def never_over_picked(self):
+        for item in self.station.matcher.current_items.values():
+            assert item.quantity_picked <= item.quantity_required
+
+    @invariant()
+    def counts_agree(self):
+        if not self.required:
+            return
+        matcher_counts = {
+            sku: item.quantity_picked
+            for sku, item in self.station.matcher.current_items.items()
+            if item.quantity_picked
+        }
+        assert matcher_counts == self.picked
+        assert self.station.manager.current_order['picked_items'] == self.picked
+
+    @invariant()
+    def journal_matches(self):
+        report = self.station.orders.report(self.station.log)
+        if self.required:
+            state = report[self.station.order['order_id']]
+            assert state['picked'] == self.picked
+        for order_id in self.completed:
+            assert report[order_id]['complete']
+
+    @invariant()
+    def scan_errors_match(self):
+        errors = {
+            self.station.log.name('sku', key): counts
+            for key, counts in self.station.errors.errors.items()
+        }
+        assert errors == self.scan_errors
+
+    @invariant()
+    def completed_once(self):
+        assert len(self.station.completion_files()) == len(self.completed)
+        expected = 1 if self.required and self.picked == self.required else 0
+        assert self.complete_signals == expected
+
+
+TestPickStateMachine = PickStateMachine.TestCase
+TestPickStateMachine.settings = settings(
+    max_examples=50, stateful_step_count=40, deadline=None
+)
+
+
+class TestConcurrentScans(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.station = Station(self.tmp_dir.name)
+        self.order = {
+            "order_id": "LOAD001",
+            "items": [{"sku": sku, "quantity": 40} for sku in SKUS]
+        }
+        self.station.load(self.order)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_threads(self, target, count=8):
+        threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_concurrent_scans_keep_invariants(self):
+        """Test cameras scanning one order in parallel never over-pick"""
+        signals = []
+
+        def camera(index):
+            for i in range(200):
+                sku = SKUS[(index + i) % len(SKUS)]
+                if self.station.scan(sku, 1 + i % 3)["order_complete"]:
+                    signals.append(index)
+
+        self.run_threads(camera)
+
+        self.assertEqual(len(signals), 1)
+        picked = {sku: item.quantity_picked
+                  for sku, item in self.station.matcher.current_items.items()}
+        self.assertEqual(picked, {sku: 40 for sku in SKUS})
+        self.assertEqual(self.station.manager.current_order['picked_items'], picked)
+        report = self.station.orders.report(self.station.log)
+        self.assertEqual(report["LOAD001"]['picked'], picked)
+
+    def test_concurrent_completion_once(self):
+        """Test racing completions write a single completion file"""
+        for item in self.order["items"]:
+            self.station.scan(item["sku"], item["quantity"])
+        failures = []
+
+        def complete(index):
+            try:
+                self.station.manager.complete_order("LOAD001")
+            except RuntimeError:
+                failures.append(index)
+
+        self.run_threads(complete)
+
+        self.assertEqual(len(failures), 7)
+        files = self.station.completion_files()
+        self.assertEqual(len(files), 1)
+        with open(files[0]) as f:
+            self.assertEqual(json.load(f)['picked_items'], {sku: 40 for sku in SKUS})
+
+    def test_scan_racing_completion(self):
+        """Test a completion cannot unload the order mid-scan"""
+        manager = self.station.manager
+        in_lookup = threading.Event()
+        resume = threading.Event()
+
+        class PausingItems(list):
+            def __iter__(self):
+                if threading.current_thread().name == "scan":
+                    in_lookup.set()
+                    resume.wait(timeout=5)
+                return super().__iter__()
+
+        manager.current_order['items'] = PausingItems(manager.current_order['items'])
+        errors = []
+
+        def scan():
+            try:
+                manager.update_order(SKUS[0], 1)
+            except Exception as e:
+                errors.append(e)
+
+        scanner = threading.Thread(target=scan, name="scan")
+        completer = threading.Thread(
+            target=manager.complete_order, args=("LOAD001",)
+        )
+        scanner.start()
+        in_lookup.wait(timeout=5)
+        completer.start()
+        completer.join(timeout=0.2)
+        resume.set()
+        scanner.join()
+        completer.join()
+
+        self.assertEqual(errors, [])
+        self.assertIsNone(manager.current_order)
+        with open(self.station.completion_files()[0]) as f:
+            self.assertEqual(json.load(f)['picked_items'], {SKUS[0]: 1})
+
+    def test_pick_log_rows_stay_aligned(self):
+        """Test concurrent recording keeps each row's columns together"""
+        def camera(index):
+            for i in range(500):
+                self.station.log.record(
+                    EventType.SCAN_VALID, "LOAD001", SKUS[index % len(SKUS)],
+                    quantity=index + 1, station=f"CAM{index}"
+                )
+
+        self.run_threads(camera)
+
+        columns = self.station.log.columns
+        for station, sku, quantity in zip(
+            columns['station'], columns['sku'], columns['quantity']
+        ):
+            if quantity:
+                name = self.station.log.name('station', station)
+                self.assertEqual(name, f"CAM{quantity - 1}")
+                self.assertEqual(self.station.log.name('sku', sku),
+                                 SKUS[(quantity - 1) % len(SKUS)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+import tempfile
+from replica import LocalFeed, OrderReplica
+
+class TestOrderReplica(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.feed = LocalFeed()
+        self.replica = OrderReplica(self.feed, data_dir=self.tmp_dir.name)
+        self.order = {
+            "order_id": "TEST001",
+            "items": [{"sku": "ABC123", "quantity": 2}]
+        }
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def complete(self, order_id, version=None):
+        if version is None:
+            version = self.replica.checkout(order_id)[1]
+        return self.replica.queue_completion({
+            "order_id": order_id,
+            "picked_items": {"ABC123": 2}
+        }, version)
+
+    def test_pull_orders(self):
+        """Test new orders are pulled into the replica"""
+        self.feed.publish(self.order)
+        summary = self.replica.sync()
+
+        self.assertEqual(summary["pulled"], 1)
+        self.assertEqual(self.replica.get_order("TEST001"), self.order)
+
+    def test_delta_sync_transfers_only_changes(self):
+        """Test a resync pulls only orders changed since the last one"""
+        for i in range(10):
+            self.feed.publish({"order_id": f"ORD{i}", "items": []})
+        self.replica.sync()
+
+        self.feed.publish({"order_id": "ORD3", "items": [{"sku": "X", "quantity": 1}]})
+        self.feed.publish({"order_id": "ORD3", "items": [{"sku": "X", "quantity": 2}]})
+        summary = self.replica.sync()
+
+        self.assertEqual(summary["pulled"], 1)
+        self.assertEqual(self.replica.get_order("ORD3")["items"][0]["quantity"], 2)
+
+    def test_cancel_removes_order(self):
+        """Test cancelled orders leave the replica"""
+        self.feed.publish(self.order)
+        self.replica.sync()
+        self.feed.cancel("TEST001")
+        self.replica.sync()
+        self.assertIsNone(self.replica.get_order("TEST001"))
+
+    def test_other_zones_ignored(self):
+        """Test only the replica's zone is pulled"""
+        self.feed.publish(self.order, zone="freezer")
+        self.replica.sync()
+        self.assertIsNone(self.replica.get_order("TEST001"))
+
+    def test_offline_picking_and_reconnect(self):
+        """Test completions queue offline and sync once reconnected"""
+        self.feed.publish(self.order)
+        self.replica.sync()
+        self.feed.online = False
+
+        # Reads and completions work without the feed
+        self.assertIsNotNone(self.replica.get_order("TEST001"))
+        self.complete("TEST001")
+        summary = self.replica.sync()
+        self.assertFalse(summary["online"])
+        self.assertEqual(len(self.replica.outbox), 1)
+
+        self.feed.online = True
+        summary = self.replica.sync()
+        self.assertEqual(summary["pushed"], 1)
+        self.assertEqual(summary["conflicts"], [])
+        self.assertEqual(self.replica.outbox, [])
+        self.assertIn("TEST001", self.feed.completions)
+
+    def test_conflict_on_changed_order(self):
+        """Test completing an order changed upstream is flagged"""
+        self.feed.publish(self.order)
+        self.replica.sync()
+        self.feed.online = False
+        self.complete("TEST001")
+        self.feed.publish({"order_id": "TEST001", "items": [{"sku": "ABC123", "quantity": 5}]})
+
+        self.feed.online = True
+        summary = self.replica.sync()
+        self.assertEqual(summary["conflicts"][0]["reason"],
+                         "Order changed since it was picked")
+        self.assertEqual(len(self.replica.conflicts), 1)
+
+    def test_take_conflicts_reports_each_once(self):
+        """Test new conflicts are handed out once and survive a restart"""
+        self.feed.publish(self.order)
+        self.replica.sync()
+        self.complete("TEST001")
+        self.feed.cancel("TEST001")
+        self.replica.sync()
+
+        restarted = OrderReplica(self.feed, data_dir=self.tmp_dir.name)
+        conflicts = restarted.take_conflicts()
+        self.assertEqual([c["reason"] for c in conflicts], ["Order cancelled"])
+        self.assertEqual(restarted.take_conflicts(), [])
+        restarted = OrderReplica(self.feed, data_dir=self.tmp_dir.name)
+        self.assertEqual(restarted.take_conflicts(), [])
+
+    def test_conflict_on_change_pulled_mid_pick(self):
+        """Test a change synced while picking conflicts with the load version"""
+        self.feed.publish(self.order)
+        self.replica.sync()
+        order, version = self.replica.checkout("TEST001")
+
+        self.feed.publish({"order_id": "TEST001", "items": [{"sku": "ABC123", "quantity": 5}]})
+        self.replica.sync()
+        self.complete("TEST001", version)
+
+        summary = self.replica.sync()
+        self.assertEqual(summary["conflicts"][0]["reason"],
+                         "Order changed since it was picked")
+
+    def test_conflict_on_cancelled_order(self):
+        """Test completing an order cancelled upstream is flagged"""
+        self.feed.publish(self.order)
+        self.replica.sync()
+        self.complete("TEST001")
+        self.feed.cancel("TEST001")
+
+        summary = self.replica.sync()
+        self.assertEqual(summary["conflicts"][0]["reason"], "Order cancelled")
+
+    def test_state_persists(self):
+        """Test the replica and outbox survive a restart"""
+        self.feed.publish(self.order)
+        self.feed.publish({"order_id": "TEST002", "items": []})
+        self.replica.sync()
+        self.feed.online = False
+        self.complete("TEST002")
+
+        restarted = OrderReplica(self.feed, data_dir=self.tmp_dir.name)
+        self.assertEqual(restarted.seq, 2)
+        self.assertEqual(restarted.get_order("TEST001"), self.order)
+        self.assertEqual(len(restarted.outbox), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import tempfile
+from pathlib import Path
+from scale import SerialScale, StandInScale, count_from_weight
+
+class TestCountFromWeight(unittest.TestCase):
+    def test_exact_count(self):
+        """Test a reading of whole units"""
+        self.assertEqual(count_from_weight(5100, 510), 10)
+
+    def test_count_with_tare_and_noise(self):
+        """Test tare is removed and small noise is tolerated"""
+        self.assertEqual(count_from_weight(5230 + 40, 510, tare=200), 10)
+
+    def test_ambiguous_reading(self):
+        """Test readings between whole counts are rejected"""
+        with self.assertRaises(ValueError):
+            count_from_weight(5355, 510)
+
+    def test_empty_scale(self):
+        """Test a reading below one unit is rejected"""
+        with self.assertRaises(ValueError):
+            count_from_weight(20, 510)
+
+class TestScales(unittest.TestCase):
+    def test_stand_in_scale(self):
+        """Test the stand-in scale returns the set weight"""
+        scale = StandInScale()
+        scale.set_weight(1020)
+        self.assertEqual(scale.read_weight(), 1020)
+
+    def test_stand_in_reading_file(self):
+        """Test the stand-in scale reads its weight from a file"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reading = Path(tmp_dir) / "scale.txt"
+            reading.write_text("2550.5\n")
+            self.assertEqual(StandInScale(reading_file=reading).read_weight(), 2550.5)
+
+    def test_parse_serial_reading(self):
+        """Test parsing scale replies in different units"""
+        self.assertEqual(SerialScale.parse_reading("ST,GS,  1.250 kg\r\n"), 1250.0)
+        self.assertEqual(SerialScale.parse_reading("  340 g"), 340.0)
+        with self.assertRaises(RuntimeError):
+            SerialScale.parse_reading("ERR")
+
+if __name__ == '__main__':
+    unittest.main()